@@ -0,0 +1,158 @@
+import argparse
+import gzip
+import hashlib
+import json
+from functools import lru_cache
+
+from aiohttp import web
+
+from consultas import (ARQUIVO_DADOS, FILTROS, carregar_dados, contar_habilidades, filtrar_dados, media_salarial,
+                       progressao_niveis, versao_dados)
+
+try:
+    import orjson
+except ImportError:  # orjson é opcional: sem ele usamos o json da biblioteca padrão
+    orjson = None
+
+
+# Quantidade padrão e máxima de habilidades retornadas por cargo
+LIMITE_HABILIDADES = 10
+LIMITE_MAXIMO_HABILIDADES = 200
+
+# Respostas menores que isso não compensam ser comprimidas
+TAMANHO_MINIMO_GZIP = 512
+
+
+# Função para serializar a resposta em JSON (orjson quando disponível)
+def para_json(dados):
+    if orjson is not None:
+        return orjson.dumps(dados)
+    return json.dumps(dados, ensure_ascii=False).encode("utf-8")
+
+
+# Função para converter uma tabela em lista de registros (NaN vira null)
+def registros(tabela):
+    tabela = tabela.astype(object)
+    return tabela.where(tabela.notna(), None).to_dict(orient="records")
+
+
+# Função para conferir o If-None-Match: "*" ou uma lista de ETags separadas por vírgula, cada
+# uma comparada exatamente (comparação fraca da RFC 7232: o prefixo W/ é ignorado)
+def etag_confere(if_none_match, etag):
+    if not if_none_match:
+        return False
+    if if_none_match.strip() == "*":
+        return True
+    return any(tag.strip().removeprefix("W/") == etag for tag in if_none_match.split(","))
+
+
+# Função para ler o Accept-Encoding (codificações com peso q) e decidir se o gzip é aceito.
+# O gzip vale pelo próprio peso; sem ele na lista, vale o peso de "*"; q=0 significa recusado.
+def aceita_gzip(accept_encoding):
+    pesos = {}
+    for item in (accept_encoding or "").split(","):
+        codificacao, *parametros = [parte.strip() for parte in item.split(";")]
+        if not codificacao:
+            continue
+        peso = 1.0
+        for parametro in parametros:
+            nome, _, valor = parametro.partition("=")
+            if nome.strip().lower() == "q":
+                try:
+                    peso = float(valor)
+                except ValueError:
+                    peso = 0.0
+        pesos[codificacao.lower()] = peso
+    for codificacao in ("gzip", "x-gzip", "*"):
+        if codificacao in pesos:
+            return pesos[codificacao] > 0
+    return False
+
+
+# Consultas expostas pela API (mesmas funções usadas pelo painel)
+def consulta_setores(df, parametros):
+    return registros(media_salarial(filtrar_dados(df, **parametros), "setor"))
+
+
+def consulta_progressao(df, parametros):
+    progressao = progressao_niveis(filtrar_dados(df, **parametros))
+    progressao["nivel"] = progressao["nivel"].astype(str)
+    return registros(progressao)
+
+
+def consulta_habilidades(df, parametros):
+    cargo = parametros.get("cargo")
+    if not cargo:
+        raise web.HTTPBadRequest(text="Informe o parâmetro 'cargo'.")
+    try:
+        limite = int(parametros.get("limite", LIMITE_HABILIDADES))
+    except ValueError:
+        raise web.HTTPBadRequest(text="O parâmetro 'limite' deve ser um número inteiro.")
+    if limite < 1:
+        raise web.HTTPBadRequest(text="O parâmetro 'limite' deve ser maior que zero.")
+    return registros(contar_habilidades(df, cargo).head(min(limite, LIMITE_MAXIMO_HABILIDADES)))
+
+
+CONSULTAS = {
+    "setores": (consulta_setores, list(FILTROS)),
+    "progressao": (consulta_progressao, list(FILTROS)),
+    "habilidades": (consulta_habilidades, ["cargo", "limite"]),
+}
+
+
+# Função para criar a aplicação com a base já carregada e o cache de respostas
+def criar_app(df, tamanho_cache=1024):
+    versao = versao_dados(df)
+
+    # Cache de respostas prontas (JSON puro e comprimido), chaveado pela consulta e seus parâmetros.
+    # Cada codificação tem a sua ETag forte, como exige a RFC 7232.
+    @lru_cache(maxsize=tamanho_cache)
+    def responder(nome, parametros):
+        funcao, _ = CONSULTAS[nome]
+        corpo = para_json({"versao": versao, "dados": funcao(df, dict(parametros))})
+        chave = "%s-%s" % (versao, hashlib.sha1(repr((nome, parametros)).encode("utf-8")).hexdigest()[:12])
+        corpo_gzip = gzip.compress(corpo, compresslevel=6) if len(corpo) >= TAMANHO_MINIMO_GZIP else None
+        return corpo, corpo_gzip, f'"{chave}"', f'"{chave}-gzip"'
+
+    async def tratar_consulta(request):
+        nome = request.match_info["consulta"]
+        if nome not in CONSULTAS:
+            raise web.HTTPNotFound(text=f"Consulta desconhecida: {nome}")
+        _, aceitos = CONSULTAS[nome]
+        parametros = tuple(sorted((chave, valor) for chave, valor in request.query.items() if chave in aceitos))
+
+        corpo, corpo_gzip, etag, etag_gzip = responder(nome, parametros)
+        usar_gzip = corpo_gzip is not None and aceita_gzip(request.headers.get("Accept-Encoding"))
+        if usar_gzip:
+            corpo, etag = corpo_gzip, etag_gzip
+        cabecalhos = {"ETag": etag, "Cache-Control": "no-cache", "Vary": "Accept-Encoding"}
+        if etag_confere(request.headers.get("If-None-Match"), etag):
+            return web.Response(status=304, headers=cabecalhos)
+        if usar_gzip:
+            cabecalhos["Content-Encoding"] = "gzip"
+        return web.Response(body=corpo, content_type="application/json", charset="utf-8", headers=cabecalhos)
+
+    async def tratar_versao(request):
+        return web.json_response({"versao": versao, "linhas": len(df)})
+
+    app = web.Application()
+    app.router.add_get("/api/versao", tratar_versao)
+    app.router.add_get("/api/{consulta}", tratar_consulta)
+    return app
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="API JSON com as consultas do painel.")
+    parser.add_argument("--arquivo", default=ARQUIVO_DADOS, help="nome base do arquivo de dados (CSV ou XLSX)")
+    parser.add_argument("--host", default="127.0.0.1")
+    parser.add_argument("--porta", type=int, default=8080)
+    args = parser.parse_args(argv)
+
+    df = carregar_dados(args.arquivo)
+    if df.empty:
+        parser.error("Arquivo de dados não encontrado. Certifique-se de que o arquivo CSV ou XLSX está na pasta.")
+    web.run_app(criar_app(df), host=args.host, port=args.porta)
+
+
+if __name__ == "__main__":
+    main()
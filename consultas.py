@@ -0,0 +1,239 @@
+import hashlib
+import os
+
+import numpy as np
+import pandas as pd
+
+from distribuicao import BORDAS_SALARIO
+from tendencias import FREQUENCIAS, atualizar_baldes, gravar_baldes, ler_baldes, montar_baldes, vagas_novas
+from validacao import validar_dados
+
+
+# Nome base do arquivo de dados (aceita CSV ou XLSX)
+ARQUIVO_DADOS = "Vagas_glass_fina_l"
+
+# Versão do preparo dos dados: incrementar sempre que preparar_dados mudar, para invalidar o cache
+VERSAO_PREPARO = 4
+
+# Ordem dos níveis para os gráficos
+ORDEM_NIVEIS = ['Junior', 'Pleno', 'Senior', 'Coordenação', 'Gerência', 'Diretoria', 'Outros']
+
+# Colunas usadas como filtros no painel, com o rótulo de "sem filtro" de cada uma
+FILTROS = {"setor": "Todos", "area": "Todas", "regiao": "Todas", "empresa": "Todas"}
+
+
+# Função para ler os dados aceitando CSV ou XLSX (retorna vazio se não encontrar)
+def ler_dados(arquivo=ARQUIVO_DADOS):
+    if os.path.exists(f"{arquivo}.csv"):
+        return pd.read_csv(f"{arquivo}.csv")
+    elif os.path.exists(f"{arquivo}.xlsx"):
+        return pd.read_excel(f"{arquivo}.xlsx")
+    else:
+        return pd.DataFrame()
+
+
+# Função para classificar nível do cargo
+def classificar_nivel(cargo):
+    cargo = cargo.lower()
+    if any(word in cargo for word in ['junior', 'jr', 'trainee', 'estágio', 'estagio', 'assistente']):
+        return 'Junior'
+    elif any(word in cargo for word in ['pleno', 'pl']):
+        return 'Pleno'
+    elif any(word in cargo for word in ['senior', 'sr', 'especialista', 'expert']):
+        return 'Senior'
+    elif any(word in cargo for word in ['coordenador', 'supervisor', 'líder', 'lider']):
+        return 'Coordenação'
+    elif any(word in cargo for word in ['gerente', 'gestor']):
+        return 'Gerência'
+    elif any(word in cargo for word in ['diretor', 'head']):
+        return 'Diretoria'
+    else:
+        return 'Outros'
+
+
+# Função para preparar os dados brutos: validação, nível, indicador de alta e salário numérico
+def preparar_dados(df):
+    # Esquema, conversão de salários e quarentena de outliers (ver validacao.py)
+    df = validar_dados(df)
+
+    # Cargo como categoria: agrupamentos por cargo usam os códigos inteiros
+    df['cargo'] = df['cargo'].astype('category')
+
+    # Adicionar coluna de nível (classifica cada cargo distinto uma única vez)
+    niveis_por_cargo = {cargo: classificar_nivel(cargo) for cargo in df['cargo'].cat.categories}
+    df['nivel'] = pd.Categorical(df['cargo'].map(niveis_por_cargo).astype(object), categories=ORDEM_NIVEIS)
+
+    # Indicador booleano de profissão em alta, calculado uma vez no carregamento
+    df['em_alta_flag'] = df['em_alta'].notna()
+    return df
+
+
+# Função para montar o caminho do cache com a base já preparada
+def caminho_cache(arquivo=ARQUIVO_DADOS):
+    return f"{arquivo}.preparado.v{VERSAO_PREPARO}.parquet"
+
+
+# Função para montar o caminho do cache dos baldes de tempo de uma frequência
+def caminho_baldes(frequencia, arquivo=ARQUIVO_DADOS):
+    return f"{arquivo}.baldes.{frequencia}.v{VERSAO_PREPARO}.parquet"
+
+
+# Função para verificar se os baldes gravados estão em dia com a base preparada em cache
+def baldes_em_dia(arquivo=ARQUIVO_DADOS):
+    cache = caminho_cache(arquivo)
+    caminhos = [caminho_baldes(frequencia, arquivo) for frequencia in FREQUENCIAS.values()]
+    return os.path.exists(cache) and all(
+        os.path.exists(caminho) and os.path.getmtime(caminho) >= os.path.getmtime(cache) for caminho in caminhos)
+
+
+# Função para ler a base preparada anterior, usada para achar as vagas novas na ingestão
+# (None se não houver cache ou se os baldes gravados não corresponderem a ele)
+def base_anterior(arquivo=ARQUIVO_DADOS):
+    if not baldes_em_dia(arquivo):
+        return None
+    try:
+        return pd.read_parquet(caminho_cache(arquivo))
+    except (ImportError, OSError, ValueError):
+        return None
+
+
+# Função para atualizar os baldes de tempo na ingestão: soma só as vagas novas aos baldes já
+# gravados ou, se a base anterior mudou, monta os baldes de novo a partir da base inteira
+def atualizar_cache_baldes(df, anterior, arquivo=ARQUIVO_DADOS):
+    novas = vagas_novas(anterior, df)
+    for frequencia in FREQUENCIAS.values():
+        caminho = caminho_baldes(frequencia, arquivo)
+        baldes = ler_baldes(caminho) if novas is not None else None
+        if baldes is None:
+            baldes = montar_baldes(df, BORDAS_SALARIO, frequencia)
+        else:
+            baldes = atualizar_baldes(baldes, novas, BORDAS_SALARIO, frequencia)
+        gravar_baldes(baldes, caminho)
+
+
+# Função para carregar a base já preparada. Na primeira execução lê o CSV/XLSX e grava um
+# cache em Parquet, junto com os baldes de tempo; nas seguintes lê só o cache (sem importar o
+# openpyxl). Quando o arquivo original muda, os baldes recebem só as vagas novas.
+def carregar_dados(arquivo=ARQUIVO_DADOS, usar_cache=True):
+    cache = caminho_cache(arquivo)
+    origens = [f"{arquivo}.csv", f"{arquivo}.xlsx"]
+    modificado = max((os.path.getmtime(origem) for origem in origens if os.path.exists(origem)), default=None)
+
+    if usar_cache and os.path.exists(cache) and (modificado is None or os.path.getmtime(cache) >= modificado):
+        try:
+            return pd.read_parquet(cache)
+        except (ImportError, OSError, ValueError):
+            pass  # Cache ilegível ou sem pyarrow: volta para o arquivo original
+
+    df = ler_dados(arquivo)
+    if df.empty:
+        return df
+    df = preparar_dados(df)
+    if usar_cache:
+        anterior = base_anterior(arquivo)
+        try:
+            df.to_parquet(cache, index=False)
+            atualizar_cache_baldes(df, anterior, arquivo)
+        except (ImportError, OSError, ValueError):
+            pass  # Sem pyarrow ou pasta sem permissão de escrita: segue sem cache
+    return df
+
+
+# Função para carregar os baldes de tempo de uma frequência: lê os gravados na ingestão ou,
+# sem cache, monta a partir da base já carregada
+def carregar_baldes(df, frequencia, arquivo=ARQUIVO_DADOS):
+    if baldes_em_dia(arquivo):
+        baldes = ler_baldes(caminho_baldes(frequencia, arquivo))
+        if baldes is not None:
+            return baldes
+    return montar_baldes(df, BORDAS_SALARIO, frequencia)
+
+
+# Função para calcular a versão da base: muda sempre que o conteúdo dos dados mudar.
+# Calculada uma vez por carga, serve de chave para os caches que dependem da base.
+def versao_dados(df):
+    return hashlib.sha1(pd.util.hash_pandas_object(df, index=False).to_numpy().tobytes()).hexdigest()[:16]
+
+
+# Função para aplicar os filtros do painel (None ou o rótulo "Todos"/"Todas" = sem filtro)
+def filtrar_dados(df, **filtros):
+    mascara = np.ones(len(df), dtype=bool)
+    for coluna, valor in filtros.items():
+        if valor is not None and valor != FILTROS.get(coluna):
+            mascara &= (df[coluna] == valor).to_numpy()
+    return df[mascara]
+
+
+# Função para converter as escolhas do painel em filtros do cubo (None = sem filtro)
+def filtros_cubo(**filtros):
+    return {coluna: None if valor == FILTROS.get(coluna) else valor for coluna, valor in filtros.items()}
+
+
+# Função para calcular a média salarial agrupada por uma ou mais colunas
+def media_salarial(df, colunas):
+    return df.groupby(colunas, observed=True)["salario"].mean().reset_index()
+
+
+# Função para listar as 10 áreas com maior salário médio
+def top_areas(df, n=10):
+    return df.groupby("area")["salario"].mean().sort_values(ascending=False).head(n).reset_index()
+
+
+# Função para listar os cargos em alta de cada setor
+def em_alta_por_setor(df):
+    em_alta = df[df["em_alta_flag"]]
+    em_alta_setor = em_alta.groupby("setor")["cargo"].agg(list).reset_index()
+    em_alta_setor["cargo"] = em_alta_setor["cargo"].apply(lambda x: ', '.join(x))
+    return em_alta_setor
+
+
+# Função para comparar salários por porte de empresa
+def salarios_por_porte(df):
+    salary_by_size = df.groupby("empresa")["salario"].agg(["mean", "min", "max"]).reset_index()
+    salary_by_size.columns = ["Porte da Empresa", "Média", "Mínimo", "Máximo"]
+    return salary_by_size
+
+
+# Função para montar a tabela de cargos e salários em uma única passada
+def estatisticas_cargos(df):
+    cargo_stats = df.groupby("cargo", observed=True).agg(
+        media=("salario", "mean"),
+        minimo=("salario", "min"),
+        maximo=("salario", "max"),
+        em_alta=("em_alta_flag", "any"),
+        setor=("setor", "first"),
+        area=("area", "first"),
+        nivel=("nivel", "first")
+    ).reset_index()
+    cargo_stats["em_alta"] = np.where(cargo_stats["em_alta"], "Sim", "Não")
+    cargo_stats.columns = ["Cargo", "Média Salarial", "Salário Mínimo", "Salário Máximo", "Em Alta", "Setor", "Área", "Nível"]
+    return cargo_stats
+
+
+# Função para calcular média, mínimo e máximo por nível, na ordem da carreira
+def progressao_niveis(df):
+    nivel_filtered = df.groupby('nivel', observed=True)['salario'].agg(['mean', 'min', 'max']).reset_index()
+    nivel_existentes = [nivel for nivel in ORDEM_NIVEIS if nivel in nivel_filtered['nivel'].unique()]
+    nivel_filtered['nivel'] = pd.Categorical(nivel_filtered['nivel'].astype(str), categories=nivel_existentes, ordered=True)
+    return nivel_filtered.sort_values('nivel')
+
+
+# Função para listar os cargos em alta demanda com seus dados principais
+def cargos_em_alta(df):
+    return df[df["em_alta_flag"]][["cargo", "setor", "area", "empresa", "salario", "nivel"]]
+
+
+# Função para contar as habilidades pedidas para um cargo
+def contar_habilidades(df, cargo):
+    # Filtra os dados pelo cargo selecionado
+    cargo_df = df[df["cargo"] == cargo]
+
+    # Combina todas as habilidades em uma lista
+    habilidades_lista = ",".join(cargo_df["habilidade"].dropna()).split(",")
+    habilidades_lista = [h.strip() for h in habilidades_lista if h.strip()]  # Remove espaços e vazios
+    habilidades_lista = [h for h in habilidades_lista if h.lower() != 'não informadas'] # remove habilidades não informadas
+
+    # Conta as habilidades
+    habilidades_contagem = pd.Series(habilidades_lista).value_counts().reset_index()
+    habilidades_contagem.columns = ["Habilidade", "Frequência"]
+    return habilidades_contagem
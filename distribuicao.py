@@ -0,0 +1,117 @@
+import numpy as np
+import pandas as pd
+
+from validacao import SALARIO_MAXIMO_VALIDO, SALARIO_MINIMO_VALIDO
+
+
+# Dimensões de cada célula do cubo de histogramas (filtros do painel + cargo e nível)
+DIMENSOES_CUBO = ["setor", "area", "regiao", "empresa", "cargo", "nivel"]
+
+# Quantidade de faixas salariais fixas (espaçadas em escala logarítmica)
+N_FAIXAS = 160
+
+# Bordas das faixas, entre os limites aceitos na validação. São as mesmas no cubo, no histograma
+# e nos baldes de tendência, e não dependem da base: contagens gravadas continuam somáveis
+# quando novas vagas chegam.
+BORDAS_SALARIO = np.geomspace(SALARIO_MINIMO_VALIDO, SALARIO_MAXIMO_VALIDO, N_FAIXAS + 1)
+
+
+# Função para listar as colunas de contagem (uma por faixa) de um cubo
+def colunas_faixas(cubo):
+    return [c for c in cubo.columns if isinstance(c, (int, np.integer))]
+
+
+# Função para montar o cubo: uma linha por célula, com a contagem de vagas em cada
+# faixa salarial e o mínimo/máximo exatos. Células podem ser somadas livremente.
+def montar_cubo(df, bordas, dimensoes=DIMENSOES_CUBO):
+    dados = df.loc[df["salario"].notna(), dimensoes + ["salario"]]
+    n_faixas = len(bordas) - 1
+    faixa = np.searchsorted(bordas, dados["salario"].to_numpy(), side="right") - 1
+    dados = dados.assign(faixa=np.clip(faixa, 0, n_faixas - 1))
+
+    grupos = dados.groupby(dimensoes, observed=True, dropna=False)
+    extremos = grupos["salario"].agg(minimo="min", maximo="max")
+    contagens = (
+        dados.groupby(dimensoes + ["faixa"], observed=True, dropna=False)
+        .size()
+        .unstack("faixa", fill_value=0)
+        .reindex(columns=range(n_faixas), fill_value=0)
+        .astype(np.int32)
+    )
+    return extremos.join(contagens)
+
+
+# Função para selecionar as células do cubo que atendem aos filtros (None = sem filtro)
+def fatiar_cubo(cubo, **filtros):
+    mascara = np.ones(len(cubo), dtype=bool)
+    for dimensao, valor in filtros.items():
+        if valor is not None:
+            mascara &= (cubo.index.get_level_values(dimensao) == valor)
+    return cubo[mascara]
+
+
+# Função para juntar células somando as contagens (e combinando mínimos e máximos)
+def agregar_cubo(cubo, por=None):
+    faixas = colunas_faixas(cubo)
+    if por is None:
+        return pd.DataFrame([{
+            "minimo": cubo["minimo"].min(),
+            "maximo": cubo["maximo"].max(),
+            **cubo[faixas].sum().to_dict(),
+        }])
+    grupos = cubo.groupby(level=por, observed=True, dropna=False)
+    agregado = grupos[faixas].sum()
+    agregado.insert(0, "maximo", grupos["maximo"].max())
+    agregado.insert(0, "minimo", grupos["minimo"].min())
+    return agregado
+
+
+# Função para estimar quantis a partir das contagens por faixa (interpolação na faixa)
+def quantis_histograma(contagens, bordas, quantis):
+    contagens = np.atleast_2d(np.asarray(contagens, dtype=float))
+    acumulado = contagens.cumsum(axis=1)
+    total = acumulado[:, -1:]
+    resultado = {}
+    for q in quantis:
+        alvo = q * total
+        indice = np.minimum((acumulado < alvo).sum(axis=1), contagens.shape[1] - 1)
+        linhas = np.arange(len(contagens))
+        antes = acumulado[linhas, indice] - contagens[linhas, indice]
+        na_faixa = np.where(contagens[linhas, indice] > 0, contagens[linhas, indice], 1)
+        fracao = np.clip((alvo[:, 0] - antes) / na_faixa, 0, 1)
+        resultado[q] = bordas[indice] + fracao * (bordas[indice + 1] - bordas[indice])
+    return resultado
+
+
+# Função para gerar os resumos de box plot (quartis e cercas) de cada linha do cubo agregado
+def resumo_boxplot(agregado, bordas):
+    faixas = colunas_faixas(agregado)
+    contagens = agregado[faixas].to_numpy()
+    q = quantis_histograma(contagens, bordas, [0.25, 0.5, 0.75])
+    q1, mediana, q3 = q[0.25], q[0.5], q[0.75]
+    # Mantém os quartis dentro do intervalo real observado na célula
+    minimo, maximo = agregado["minimo"].to_numpy(), agregado["maximo"].to_numpy()
+    q1, mediana, q3 = (np.clip(v, minimo, maximo) for v in (q1, mediana, q3))
+    iqr = q3 - q1
+    return pd.DataFrame({
+        "n": contagens.sum(axis=1),
+        "minimo": minimo,
+        "q1": q1,
+        "mediana": mediana,
+        "q3": q3,
+        "maximo": maximo,
+        "cerca_inferior": np.maximum(minimo, q1 - 1.5 * iqr),
+        "cerca_superior": np.minimum(maximo, q3 + 1.5 * iqr),
+    }, index=agregado.index)
+
+
+# Função para suavizar um histograma (estimativa de densidade com núcleo gaussiano nas faixas)
+def densidade_suavizada(contagens, largura=2.5):
+    contagens = np.asarray(contagens, dtype=float)
+    raio = int(np.ceil(3 * largura))
+    posicoes = np.arange(-raio, raio + 1)
+    nucleo = np.exp(-0.5 * (posicoes / largura) ** 2)
+    nucleo /= nucleo.sum()
+    suavizado = np.convolve(contagens, nucleo, mode="same")
+    total = suavizado.sum()
+    return suavizado / total if total else suavizado
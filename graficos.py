@@ -0,0 +1,146 @@
+import numpy as np
+import plotly.express as px
+import plotly.graph_objects as go
+
+from consultas import ORDEM_NIVEIS
+from distribuicao import densidade_suavizada
+
+
+# Gráfico de média salarial por setor
+def grafico_media_setor(sector_analysis):
+    fig1 = px.bar(sector_analysis, x="setor", y="salario",
+                  title="Média Salarial por Setor",
+                  labels={"setor": "Setor", "salario": "Salário Médio (R$)"})
+    fig1.update_layout(xaxis_tickangle=-45, height=400)
+    return fig1
+
+
+# Gráfico de média salarial por setor e área
+def grafico_setor_area(sector_area_analysis):
+    fig2 = px.bar(sector_area_analysis, x="setor", y="salario", color="area",
+                  title="Média Salarial por Setor e Área",
+                  labels={"setor": "Setor", "salario": "Salário Médio (R$)", "area": "Área"})
+    fig2.update_layout(xaxis_tickangle=-45, height=400)
+    return fig2
+
+
+# Gráfico de média salarial por especialidade e setor
+def grafico_especialidade_setor(specialization_sector_analysis):
+    fig3 = px.bar(specialization_sector_analysis, x="especialidade", y="salario", color="setor",
+                  title="Média Salarial por Especialidade e Setor",
+                  labels={"especialidade": "Especialidade", "salario": "Salário Médio (R$)", "setor": "Setor"})
+    fig3.update_layout(xaxis_tickangle=-45, height=400)
+    return fig3
+
+
+# Gráfico das áreas com maiores salários médios
+def grafico_top_areas(top_areas):
+    fig4 = px.bar(top_areas, x="area", y="salario",
+                  title="Top 10 Áreas - Salário Médio",
+                  labels={"area": "Área", "salario": "Salário Médio (R$)"})
+    fig4.update_layout(xaxis_tickangle=-45, height=400)
+    return fig4
+
+
+# Gráfico de pizza das profissões em alta por setor
+def grafico_em_alta_setor(em_alta_setor):
+    fig5 = px.pie(em_alta_setor, values=em_alta_setor["cargo"].apply(len), names="setor",
+                  title="Distribuição de Profissões em Alta por Setor",
+                  hover_data=["cargo"],
+                  labels={"cargo": "Cargos"})
+    fig5.update_traces(hovertemplate='<b>%{label}</b><br>Cargos: %{customdata}')
+    return fig5
+
+
+# Box plot com quartis estimados a partir das faixas do cubo (sem ler as vagas)
+def grafico_boxplot(resumo_box, eixo, titulo_eixo, titulo):
+    fig6 = go.Figure()
+    for empresa, grupo in resumo_box.groupby("empresa", sort=False, dropna=False):
+        fig6.add_trace(go.Box(x=grupo[eixo].astype(str), q1=grupo["q1"], median=grupo["mediana"],
+                              q3=grupo["q3"], lowerfence=grupo["cerca_inferior"],
+                              upperfence=grupo["cerca_superior"], name=str(empresa)))
+    fig6.update_layout(boxmode="group", title=titulo, xaxis_title=titulo_eixo,
+                       yaxis_title="Salário (R$)", legend_title_text="Porte da Empresa")
+    if eixo == "nivel":
+        fig6.update_xaxes(categoryorder="array", categoryarray=ORDEM_NIVEIS)
+
+    fig6.update_layout(xaxis_tickangle=-45, height=600)
+    return fig6
+
+
+# Histograma salarial por faixas, com a curva de densidade suavizada
+def grafico_histograma(contagens, bordas, margem=8):
+    densidade = densidade_suavizada(contagens) * contagens.sum()
+    # As faixas fixas cobrem toda a faixa válida: mostra só o trecho com vagas (e uma margem)
+    ocupadas = np.flatnonzero(contagens)
+    inicio = max(ocupadas[0] - margem, 0) if len(ocupadas) else 0
+    fim = min(ocupadas[-1] + 1 + margem, len(contagens)) if len(ocupadas) else len(contagens)
+    contagens, densidade, bordas = contagens[inicio:fim], densidade[inicio:fim], bordas[inicio:fim + 1]
+    centros = np.sqrt(bordas[:-1] * bordas[1:])
+    fig_hist = go.Figure()
+    fig_hist.add_trace(go.Scatter(x=bordas, y=np.append(contagens, contagens[-1]),
+                                  mode='lines', line_shape='hv', fill='tozeroy',
+                                  name='Vagas por faixa'))
+    fig_hist.add_trace(go.Scatter(x=centros, y=densidade, mode='lines', name='Densidade suavizada',
+                                  line=dict(color='black', width=2)))
+    fig_hist.update_layout(title="Distribuição de Salários (faixas em escala logarítmica)",
+                           xaxis_title="Salário (R$)", yaxis_title="Quantidade de Vagas",
+                           xaxis_type="log", height=400)
+    return fig_hist
+
+
+# Gráfico de progressão salarial por nível
+def grafico_progressao(nivel_filtered):
+    fig_progression_filtered = go.Figure()
+    fig_progression_filtered.add_trace(go.Scatter(x=nivel_filtered['nivel'], y=nivel_filtered['mean'],
+                                                mode='lines+markers', name='Média',
+                                                line=dict(color='blue', width=2)))
+    fig_progression_filtered.add_trace(go.Scatter(x=nivel_filtered['nivel'], y=nivel_filtered['min'],
+                                                mode='lines', name='Mínimo',
+                                                line=dict(color='red', dash='dash')))
+    fig_progression_filtered.add_trace(go.Scatter(x=nivel_filtered['nivel'], y=nivel_filtered['max'],
+                                                mode='lines', name='Máximo',
+                                                line=dict(color='green', dash='dash')))
+
+    fig_progression_filtered.update_layout(
+        title="Progressão Salarial por Nível",
+        xaxis_title="Nível",
+        yaxis_title="Salário (R$)",
+        height=400
+    )
+    return fig_progression_filtered
+
+
+# Gráfico de média salarial por região
+def grafico_regional(regional_avg):
+    fig7 = px.bar(regional_avg, x="regiao", y="salario",
+                  title="Média Salarial por Região",
+                  labels={"regiao": "Região", "salario": "Salário Médio (R$)"})
+    return fig7
+
+
+# Gráfico de média salarial por especialidade
+def grafico_especialidades(spec_avg):
+    fig8 = px.bar(spec_avg, x="especialidade", y="salario",
+                  title="Média Salarial por Especialidade",
+                  labels={"especialidade": "Especialidade", "salario": "Salário Médio (R$)"})
+    fig8.update_layout(xaxis_tickangle=-45, height=400)
+    return fig8
+
+
+# Gráfico de tendência: vagas por período (barras) e mediana salarial (linha, eixo à direita)
+def grafico_tendencia(serie, titulo):
+    fig_tendencia = go.Figure()
+    fig_tendencia.add_trace(go.Bar(x=serie["periodo"], y=serie["vagas"], name="Vagas",
+                                   marker_color="lightsteelblue"))
+    fig_tendencia.add_trace(go.Scatter(x=serie["periodo"], y=serie["mediana"], name="Mediana Salarial",
+                                       mode="lines+markers", yaxis="y2",
+                                       line=dict(color="darkblue", width=2)))
+    fig_tendencia.update_layout(
+        title=titulo,
+        xaxis_title="Período",
+        yaxis=dict(title="Quantidade de Vagas"),
+        yaxis2=dict(title="Mediana Salarial (R$)", overlaying="y", side="right"),
+        height=450
+    )
+    return fig_tendencia
@@ -1,124 +1,93 @@
 import streamlit as st
 import pandas as pd
 import json
-import os
-import numpy as np
-
-import plotly.express as px
-import plotly.graph_objects as go
 
 import streamlit.components.v1 as components
 
+from consultas import (ORDEM_NIVEIS, cargos_em_alta as listar_cargos_em_alta, carregar_baldes as ler_baldes_tempo,
+                       carregar_dados, contar_habilidades, em_alta_por_setor, estatisticas_cargos, filtrar_dados,
+                       filtros_cubo as montar_filtros_cubo, media_salarial, progressao_niveis, salarios_por_porte,
+                       top_areas as calcular_top_areas, versao_dados)
+from distribuicao import BORDAS_SALARIO, agregar_cubo, fatiar_cubo, montar_cubo, resumo_boxplot
+from graficos import (grafico_boxplot, grafico_em_alta_setor, grafico_especialidade_setor,
+                      grafico_especialidades, grafico_histograma, grafico_media_setor, grafico_progressao,
+                      grafico_regional, grafico_setor_area, grafico_tendencia, grafico_top_areas)
+from tabelas import exibir_tabela_paginada
+from tendencias import FREQUENCIAS, serie_temporal
+from validacao import quarentena, resumo_validacao, vagas_sem_salario
+
 
 # Configuração da página para tela cheia
 st.set_page_config(page_title="Painel de Escolha Profissional - 2025", layout="wide")
 # Estabelecer conexão com o banco de dados MySQL
-# Função para carregar dados aceitando CSV ou XLSX
+# Função para carregar dados aceitando CSV ou XLSX (já preparados, via cache em Parquet),
+# junto com a versão da base, usada como chave dos caches que dependem dela
 @st.cache_data
 def load_data():
-    arquivo = "Vagas_glass_fina_l"  # Nome base do arquivo
-    if os.path.exists(f"{arquivo}.csv"):
-        return pd.read_csv(f"{arquivo}.csv")
-    elif os.path.exists(f"{arquivo}.xlsx"):
-        return pd.read_excel(f"{arquivo}.xlsx")
-    else:
+    dados = carregar_dados()
+    if dados.empty:
         st.error("Arquivo de dados não encontrado. Certifique-se de que o arquivo CSV ou XLSX está na pasta.")
-        return pd.DataFrame()
-
-df = load_data()
-
-# Função para classificar nível do cargo
-def classificar_nivel(cargo):
-    cargo = cargo.lower()
-    if any(word in cargo for word in ['junior', 'jr', 'trainee', 'estágio', 'estagio', 'assistente']):
-        return 'Junior'
-    elif any(word in cargo for word in ['pleno', 'pl']):
-        return 'Pleno'
-    elif any(word in cargo for word in ['senior', 'sr', 'especialista', 'expert']):
-        return 'Senior'
-    elif any(word in cargo for word in ['coordenador', 'supervisor', 'líder', 'lider']):
-        return 'Coordenação'
-    elif any(word in cargo for word in ['gerente', 'gestor']):
-        return 'Gerência'
-    elif any(word in cargo for word in ['diretor', 'head']):
-        return 'Diretoria'
-    else:
-        return 'Outros'
+    return dados, versao_dados(dados)
 
-# Adicionar coluna de nível
-df['nivel'] = df['cargo'].apply(classificar_nivel)
+df, versao_base = load_data()
 
 # Ordem dos níveis para os gráficos
-ordem_niveis = ['Junior', 'Pleno', 'Senior', 'Coordenação', 'Gerência', 'Diretoria', 'Outros']
+ordem_niveis = ORDEM_NIVEIS
 
 # Título do Dashboard
 st.title("Painel de Escolha Profissional - 2025")
 
 # Criar tabs para separar visão geral e detalhada
-tab1, tab2, tab3 = st.tabs(["Visão Geral", "Análise Detalhada", "Exploração Avançada"])
+tab1, tab2, tab3, tab4 = st.tabs(["Visão Geral", "Análise Detalhada", "Exploração Avançada", "Tendências"])
 
-# Substitui "Não informado" por NaN
-df["salario"] = df["salario"].replace("Não informado", np.nan)
+# Cubo de histogramas salariais: montado uma vez por base e fatiado pelos filtros.
+# A chave do cache é a versão da base (o _df não é hasheado a cada execução).
+@st.cache_data
+def carregar_cubo(_df, versao):
+    return montar_cubo(_df, BORDAS_SALARIO)
+
+cubo = carregar_cubo(df, versao_base)
 
-# Converte a coluna para float (valores não numéricos já viram NaN automaticamente)
-df["salario"] = pd.to_numeric(df["salario"], errors="coerce")
+# Índice de cargos parecidos (habilidades, salário e nível), montado uma vez por base.
+# O módulo (e o scipy) só é importado quando um cargo é escolhido, fora da inicialização.
+@st.cache_resource
+def carregar_indice_similaridade(_df, versao):
+    from similaridade import montar_indice_similaridade
+    return montar_indice_similaridade(_df)
+
+# Baldes de tempo (semanais ou mensais) usados na aba de tendências, gravados na ingestão
+# (chave do cache: versão da base e frequência)
+@st.cache_data
+def carregar_baldes(_df, versao, frequencia):
+    return ler_baldes_tempo(_df, frequencia)
 
 with tab1:
     st.header("Visão Geral do Mercado")
     
     # 1. Análise por Setor
     st.subheader("Análise por Setor")
-    sector_analysis = df.groupby("setor")["salario"].mean().reset_index()
-    fig1 = px.bar(sector_analysis, x="setor", y="salario",
-                  title="Média Salarial por Setor",
-                  labels={"setor": "Setor", "salario": "Salário Médio (R$)"})
-    fig1.update_layout(xaxis_tickangle=-45, height=400)
-    st.plotly_chart(fig1, use_container_width=True)
+    st.plotly_chart(grafico_media_setor(media_salarial(df, "setor")), use_container_width=True)
 
     # 2. Análise por Setor e Área
     st.subheader("Análise por Setor e Área")
-    sector_area_analysis = df.groupby(["setor", "area"])["salario"].mean().reset_index()
-    fig2 = px.bar(sector_area_analysis, x="setor", y="salario", color="area",
-                  title="Média Salarial por Setor e Área",
-                  labels={"setor": "Setor", "salario": "Salário Médio (R$)", "area": "Área"})
-    fig2.update_layout(xaxis_tickangle=-45, height=400)
-    st.plotly_chart(fig2, use_container_width=True)
+    st.plotly_chart(grafico_setor_area(media_salarial(df, ["setor", "area"])), use_container_width=True)
 
     # 3. Análise por Especialidade por Setor
     st.subheader("Análise por Especialidade por Setor")
-    specialization_sector_analysis = df.groupby(["especialidade", "setor"])["salario"].mean().reset_index()
-    fig3 = px.bar(specialization_sector_analysis, x="especialidade", y="salario", color="setor",
-                  title="Média Salarial por Especialidade e Setor",
-                  labels={"especialidade": "Especialidade", "salario": "Salário Médio (R$)", "setor": "Setor"})
-    fig3.update_layout(xaxis_tickangle=-45, height=400)
-    st.plotly_chart(fig3, use_container_width=True)
+    st.plotly_chart(grafico_especialidade_setor(media_salarial(df, ["especialidade", "setor"])),
+                    use_container_width=True)
 
     # 4. Top 10 Salários Médios por Área
     st.subheader("Top 10 Áreas com Maiores Salários Médios")
-    top_areas = df.groupby("area")["salario"].mean().sort_values(ascending=False).head(10).reset_index()
-    fig4 = px.bar(top_areas, x="area", y="salario",
-                  title="Top 10 Áreas - Salário Médio",
-                  labels={"area": "Área", "salario": "Salário Médio (R$)"})
-    fig4.update_layout(xaxis_tickangle=-45, height=400)
-    st.plotly_chart(fig4, use_container_width=True)
+    st.plotly_chart(grafico_top_areas(calcular_top_areas(df)), use_container_width=True)
 
     # 5. Distribuição de Profissões em Alta por Setor
     st.subheader("Setores com Profissões em Alta")
-    em_alta = df[df["em_alta"].notna()]
-    em_alta_setor = em_alta.groupby("setor")["cargo"].agg(list).reset_index()
-    em_alta_setor["cargo"] = em_alta_setor["cargo"].apply(lambda x: ', '.join(x))
-    
-    fig5 = px.pie(em_alta_setor, values=em_alta_setor["cargo"].apply(len), names="setor",
-                  title="Distribuição de Profissões em Alta por Setor",
-                  hover_data=["cargo"],
-                  labels={"cargo": "Cargos"})
-    fig5.update_traces(hovertemplate='<b>%{label}</b><br>Cargos: %{customdata}')
-    st.plotly_chart(fig5, use_container_width=True)
+    st.plotly_chart(grafico_em_alta_setor(em_alta_por_setor(df)), use_container_width=True)
 
     # 6. Comparativo de Salários por Porte de Empresa
     st.subheader("Salários por Porte de Empresa")
-    salary_by_size = df.groupby("empresa")["salario"].agg(["mean", "min", "max"]).reset_index()
-    salary_by_size.columns = ["Porte da Empresa", "Média", "Mínimo", "Máximo"]
+    salary_by_size = salarios_por_porte(df)
     st.write("""
     **Legenda - Porte das Empresas:**
     - pq: Pequeno Porte
@@ -127,22 +96,22 @@ with tab1:
     """)
     st.table(salary_by_size.round(2))
 
+    # 7. Qualidade dos dados (validação feita uma única vez, na carga)
+    with st.expander("Qualidade dos Dados"):
+        st.write("Salários descartados na validação da base, por motivo:")
+        st.table(resumo_validacao(df))
+        st.write(f"Vagas sem salário informado (não entram nas médias): {vagas_sem_salario(df):,}")
+        st.write("Vagas em quarentena (salário inválido ou atípico para o cargo e a região):")
+        exibir_tabela_paginada(quarentena(df), "quarentena", coluna_busca="cargo", ordenar_por="id", crescente=True,
+                               chave_dados=versao_base)
+
 with tab2:
     st.header("Análise Detalhada")
 
     # Função para gerar a nuvem de palavras por cargo
     def gerar_nuvem_habilidades(cargo):
-        # Filtra os dados pelo cargo selecionado
-        cargo_df = df[df["cargo"] == cargo]
-        
-        # Combina todas as habilidades em uma lista
-        habilidades_lista = ",".join(cargo_df["habilidade"].dropna()).split(",")
-        habilidades_lista = [h.strip() for h in habilidades_lista if h.strip()]  # Remove espaços e vazios
-        habilidades_lista = [h for h in habilidades_lista if h.lower() != 'não informadas'] # remove habilidades não informadas
-
-        # Conta as habilidades
-        habilidades_contagem = pd.Series(habilidades_lista).value_counts().reset_index()
-        habilidades_contagem.columns = ["Habilidade", "Frequência"]
+        # Conta as habilidades pedidas para o cargo
+        habilidades_contagem = contar_habilidades(df, cargo)
 
         # Aumenta os valores para melhorar visibilidade
         habilidades_contagem["Frequência"] = habilidades_contagem["Frequência"].apply(lambda x: x ** 1.5)
@@ -180,8 +149,8 @@ with tab2:
 
         # Exibe a Tabela das Habilidades em ordem crescente
         st.subheader("📊 Tabela de Habilidades mais Frequentes")
-        habilidades_contagem = habilidades_contagem.sort_values("Frequência", ascending=False)  # Ordena em ordem crescente
-        st.dataframe(habilidades_contagem, use_container_width=True)
+        exibir_tabela_paginada(habilidades_contagem, "habilidades", coluna_busca="Habilidade",
+                               ordenar_por="Frequência", chave_dados=(versao_base, cargo))
 
 
 
@@ -197,15 +166,8 @@ with tab2:
         escolha_empresa = st.selectbox("Porte da empresa", ["Todas"] + list(df["empresa"].dropna().unique()))
 
     # Aplicar filtros
-    filtered_df = df.copy()
-    if escolha_setor != "Todos":
-        filtered_df = filtered_df[filtered_df["setor"] == escolha_setor]
-    if escolha_area != "Todas":
-        filtered_df = filtered_df[filtered_df["area"] == escolha_area]
-    if escolha_regiao != "Todas":
-        filtered_df = filtered_df[filtered_df["regiao"] == escolha_regiao]
-    if escolha_empresa != "Todas":
-        filtered_df = filtered_df[filtered_df["empresa"] == escolha_empresa]
+    escolhas = {"setor": escolha_setor, "area": escolha_area, "regiao": escolha_regiao, "empresa": escolha_empresa}
+    filtered_df = filtrar_dados(df, **escolhas)
 
     # Filtro para selecionar o cargo
     cargo_selecionado = st.selectbox("Escolha um cargo para visualizar as habilidades", 
@@ -215,20 +177,23 @@ with tab2:
         # Gerar a nuvem de habilidades
         st.subheader(f"Nuvem de Habilidades para o cargo de {cargo_selecionado}")
         gerar_nuvem_habilidades(cargo_selecionado)
+
+        # Cargos parecidos com o selecionado, lidos do índice pré-calculado
+        from similaridade import cargos_parecidos
+        st.subheader("🧭 Cargos Parecidos")
+        parecidos = cargos_parecidos(carregar_indice_similaridade(df, versao_base), cargo_selecionado)
+        if parecidos.empty:
+            st.write("Não há habilidades suficientes para encontrar cargos parecidos.")
+        else:
+            st.dataframe(parecidos, use_container_width=True, hide_index=True)
     else:
         st.write("Selecione um cargo para ver a nuvem de habilidades associada.")
 
     # 1. Tabela de Cargos e Salários
     st.subheader("Cargos e Salários")
-    cargo_stats = filtered_df.groupby("cargo").agg({
-        "salario": ["mean", "min", "max"],
-        "em_alta": lambda x: "Sim" if x.notna().any() else "Não",
-        "setor": "first",
-        "area": "first",
-        "nivel": "first"
-    }).reset_index()
-    cargo_stats.columns = ["Cargo", "Média Salarial", "Salário Mínimo", "Salário Máximo", "Em Alta", "Setor", "Área", "Nível"]
-    st.dataframe(cargo_stats.sort_values("Média Salarial", ascending=False).round(2))
+    cargo_stats = estatisticas_cargos(filtered_df)
+    exibir_tabela_paginada(cargo_stats.round(2), "cargo_stats", coluna_busca="Cargo",
+                           ordenar_por="Média Salarial", chave_dados=(versao_base, tuple(escolhas.values())))
 
     # 2. Gráfico de Distribuição Salarial
     st.subheader("Distribuição Salarial dos Cargos")
@@ -240,90 +205,59 @@ with tab2:
         horizontal=True
     )
     
+    # Os filtros selecionados viram uma fatia do cubo de histogramas
+    filtros_cubo = montar_filtros_cubo(**escolhas)
+
     if tipo_visualizacao == "Por Cargo":
         # Filtrar cargos com dados
         cargos_disponiveis = filtered_df["cargo"].unique()
         cargo_selecionado = st.selectbox("Escolha um cargo:", ["Todos"] + list(cargos_disponiveis))
-        
-        if cargo_selecionado != "Todos":
-            dados_plot = filtered_df[filtered_df["cargo"] == cargo_selecionado]
-        else:
-            dados_plot = filtered_df
-            
-        fig6 = px.box(dados_plot, x="cargo", y="salario", 
-                      color="empresa",
-                      title="Distribuição Salarial por Cargo e Porte da Empresa",
-                      labels={"cargo": "Cargo", "salario": "Salário (R$)", "empresa": "Porte da Empresa"})
+
+        cubo_plot = fatiar_cubo(cubo, **filtros_cubo,
+                                cargo=None if cargo_selecionado == "Todos" else cargo_selecionado)
+        eixo, titulo_eixo = "cargo", "Cargo"
+        titulo_box = "Distribuição Salarial por Cargo e Porte da Empresa"
     else:
         # Usar a classificação por nível
         nivel_selecionado = st.selectbox("Escolha um nível:", ["Todos"] + ordem_niveis)
-        
-        if nivel_selecionado != "Todos":
-            dados_plot = filtered_df[filtered_df["nivel"] == nivel_selecionado]
-        else:
-            dados_plot = filtered_df
-            
-        fig6 = px.box(dados_plot, x="nivel", y="salario", 
-                      color="empresa",
-                      category_orders={"nivel": ordem_niveis},
-                      title="Distribuição Salarial por Nível e Porte da Empresa",
-                      labels={"nivel": "Nível", "salario": "Salário (R$)", "empresa": "Porte da Empresa"})
-    
-    fig6.update_layout(xaxis_tickangle=-45, height=600)
-    st.plotly_chart(fig6, use_container_width=True)
+
+        cubo_plot = fatiar_cubo(cubo, **filtros_cubo,
+                                nivel=None if nivel_selecionado == "Todos" else nivel_selecionado)
+        eixo, titulo_eixo = "nivel", "Nível"
+        titulo_box = "Distribuição Salarial por Nível e Porte da Empresa"
+
+    resumo_box = resumo_boxplot(agregar_cubo(cubo_plot, por=[eixo, "empresa"]), BORDAS_SALARIO).reset_index()
+    st.plotly_chart(grafico_boxplot(resumo_box, eixo, titulo_eixo, titulo_box), use_container_width=True)
+
+    # Histograma salarial da mesma fatia, com a curva de densidade suavizada
+    st.subheader("Histograma Salarial")
+    contagens = agregar_cubo(cubo_plot).drop(columns=["minimo", "maximo"]).iloc[0].to_numpy(dtype=float)
+    if contagens.sum() > 0:
+        st.plotly_chart(grafico_histograma(contagens, BORDAS_SALARIO), use_container_width=True)
+    else:
+        st.write("Não há salários informados para os filtros selecionados.")
 
     # 3. Gráfico de Progressão de Carreira
     st.subheader("Progressão de Carreira")
-    nivel_filtered = filtered_df.groupby('nivel')['salario'].agg(['mean', 'min', 'max']).reset_index()
-    nivel_existentes = [nivel for nivel in ordem_niveis if nivel in nivel_filtered['nivel'].unique()]
-    nivel_filtered['nivel'] = pd.Categorical(nivel_filtered['nivel'], categories=nivel_existentes, ordered=True)
-    nivel_filtered = nivel_filtered.sort_values('nivel')
-
-    
-    fig_progression_filtered = go.Figure()
-    fig_progression_filtered.add_trace(go.Scatter(x=nivel_filtered['nivel'], y=nivel_filtered['mean'],
-                                                mode='lines+markers', name='Média',
-                                                line=dict(color='blue', width=2)))
-    fig_progression_filtered.add_trace(go.Scatter(x=nivel_filtered['nivel'], y=nivel_filtered['min'],
-                                                mode='lines', name='Mínimo',
-                                                line=dict(color='red', dash='dash')))
-    fig_progression_filtered.add_trace(go.Scatter(x=nivel_filtered['nivel'], y=nivel_filtered['max'],
-                                                mode='lines', name='Máximo',
-                                                line=dict(color='green', dash='dash')))
-    
-    fig_progression_filtered.update_layout(
-        title="Progressão Salarial por Nível",
-        xaxis_title="Nível",
-        yaxis_title="Salário (R$)",
-        height=400
-    )
-    st.plotly_chart(fig_progression_filtered, use_container_width=True)
+    st.plotly_chart(grafico_progressao(progressao_niveis(filtered_df)), use_container_width=True)
 
     # 4. Análise Regional (se houver dados de região)
     if escolha_regiao == "Todas" and filtered_df["regiao"].notna().any():
         st.subheader("Análise Regional")
-        regional_avg = filtered_df.groupby("regiao")["salario"].mean().reset_index()
-        fig7 = px.bar(regional_avg, x="regiao", y="salario",
-                      title="Média Salarial por Região",
-                      labels={"regiao": "Região", "salario": "Salário Médio (R$)"})
-        st.plotly_chart(fig7, use_container_width=True)
+        st.plotly_chart(grafico_regional(media_salarial(filtered_df, "regiao")), use_container_width=True)
 
     # 5. Especialidades (se houver)
     if filtered_df["especialidade"].notna().any():
         st.subheader("Análise por Especialidade")
-        spec_avg = filtered_df.groupby("especialidade")["salario"].mean().sort_values(ascending=False).reset_index()
-        fig8 = px.bar(spec_avg, x="especialidade", y="salario",
-                      title="Média Salarial por Especialidade",
-                      labels={"especialidade": "Especialidade", "salario": "Salário Médio (R$)"})
-        fig8.update_layout(xaxis_tickangle=-45, height=400)
-        st.plotly_chart(fig8, use_container_width=True)
+        spec_avg = media_salarial(filtered_df, "especialidade").sort_values("salario", ascending=False)
+        st.plotly_chart(grafico_especialidades(spec_avg), use_container_width=True)
 
     # Insights baseados nos filtros selecionados
     st.subheader("📊 Insights")
     
     # Calcular estatísticas relevantes
     media_geral = filtered_df["salario"].mean()
-    cargos_em_alta = filtered_df[filtered_df["em_alta"].notna()][["cargo", "setor", "area", "empresa", "salario", "nivel"]]
+    cargos_em_alta = listar_cargos_em_alta(filtered_df)
     
     st.write(f"""
     **Análise dos Dados Filtrados:**
@@ -334,14 +268,64 @@ with tab2:
 
     if len(cargos_em_alta) > 0:
         st.subheader("Cargos em Alta Demanda")
-        st.dataframe(cargos_em_alta.rename(columns={
+        exibir_tabela_paginada(cargos_em_alta.rename(columns={
             "cargo": "Cargo",
             "setor": "Setor",
             "area": "Área",
             "empresa": "Porte da Empresa",
             "salario": "Salário Médio",
             "nivel": "Nível"
-        }).round(2))
+        }).round(2), "cargos_em_alta", coluna_busca="Cargo", ordenar_por="Salário Médio",
+        chave_dados=(versao_base, tuple(escolhas.values())))
+
+with tab4:
+    st.header("Tendências ao Longo do Tempo")
+
+    col1, col2 = st.columns(2)
+    with col1:
+        rotulo_frequencia = st.radio("Agrupar por", list(FREQUENCIAS), horizontal=True, key="tendencia_frequencia")
+        tendencia_setor = st.selectbox("Setor", ["Todos"] + list(df["setor"].dropna().unique()), key="tendencia_setor")
+        tendencia_regiao = st.selectbox("Região", ["Todas"] + list(df["regiao"].dropna().unique()),
+                                        key="tendencia_regiao")
+    with col2:
+        cargos_tendencia = filtrar_dados(df, setor=tendencia_setor, regiao=tendencia_regiao)["cargo"].dropna().unique()
+        tendencia_cargo = st.selectbox("Cargo", ["Todos"] + list(cargos_tendencia), key="tendencia_cargo")
+        janela = st.slider("Janela móvel (em períodos)", min_value=1, max_value=12, value=1, key="tendencia_janela")
+
+    # Série calculada a partir dos baldes pré-agregados (sem reamostrar as vagas)
+    frequencia = FREQUENCIAS[rotulo_frequencia]
+    baldes = carregar_baldes(df, versao_base, frequencia)
+    serie = serie_temporal(baldes, BORDAS_SALARIO, frequencia, janela=janela,
+                           setor=None if tendencia_setor == "Todos" else tendencia_setor,
+                           regiao=None if tendencia_regiao == "Todas" else tendencia_regiao,
+                           cargo=None if tendencia_cargo == "Todos" else tendencia_cargo)
+
+    if serie.empty:
+        st.write("Não há vagas para os filtros selecionados.")
+    else:
+        if len(serie) == 1:
+            st.info("A base tem vagas de um único período; a tendência aparece quando houver dados de mais períodos.")
+
+        # Último período comparado com o mesmo período do ano anterior
+        ultimo = serie.iloc[-1]
+        col_vagas, col_mediana = st.columns(2)
+        variacao_vagas = ultimo["vagas_variacao_anual"]
+        variacao_mediana = ultimo["mediana_variacao_anual"]
+        col_vagas.metric("Vagas no último período", f"{ultimo['vagas']:,.0f}",
+                         None if pd.isna(variacao_vagas) else f"{variacao_vagas:+.1%} vs. ano anterior")
+        col_mediana.metric("Mediana salarial no último período",
+                           "-" if pd.isna(ultimo["mediana"]) else f"R$ {ultimo['mediana']:,.2f}",
+                           None if pd.isna(variacao_mediana) else f"{variacao_mediana:+.1%} vs. ano anterior")
+
+        st.plotly_chart(grafico_tendencia(serie, f"Vagas e Mediana Salarial ({rotulo_frequencia.lower()})"),
+                        use_container_width=True)
+        st.dataframe(serie.round({"mediana": 2, "vagas_variacao_anual": 4, "mediana_variacao_anual": 4}).rename(columns={
+            "periodo": "Período",
+            "vagas": "Vagas",
+            "mediana": "Mediana Salarial",
+            "vagas_variacao_anual": "Variação Anual (Vagas)",
+            "mediana_variacao_anual": "Variação Anual (Mediana)"
+        }), use_container_width=True, hide_index=True)
 
 # with tab3:
 #     st.header("📈 Exploração Avançada dos Dados")
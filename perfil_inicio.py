@@ -0,0 +1,147 @@
+import argparse
+import ast
+import importlib
+import json
+import os
+import subprocess
+import sys
+import time
+
+
+PASTA = os.path.dirname(os.path.abspath(__file__))
+
+
+# Função para listar os módulos que o painel importa, lidos do próprio index.py (assim a lista
+# não fica desatualizada): primeiro os do topo do arquivo, na ordem em que aparecem, e depois os
+# importados só dentro de funções ou condições (sob demanda)
+def listar_modulos_painel(arquivo=os.path.join(PASTA, "index.py")):
+    with open(arquivo, encoding="utf-8") as fonte:
+        arvore = ast.parse(fonte.read())
+    topo = {id(no) for no in arvore.body}
+    importacoes = sorted((no for no in ast.walk(arvore) if isinstance(no, (ast.Import, ast.ImportFrom))),
+                         key=lambda no: (no.lineno, no.col_offset))
+
+    modulos = {}
+    for no in importacoes:
+        nomes = [alias.name for alias in no.names] if isinstance(no, ast.Import) else [no.module]
+        for nome in nomes:
+            if nome and nome not in modulos:
+                modulos[nome] = id(no) not in topo
+    return [m for m, sob_demanda in modulos.items() if not sob_demanda], \
+        [m for m, sob_demanda in modulos.items() if sob_demanda]
+
+
+# Módulos do painel: importados na inicialização e importados sob demanda
+MODULOS_PAINEL, MODULOS_SOB_DEMANDA = listar_modulos_painel()
+
+
+# Etapa: importa os módulos do painel em sequência e mede o tempo de cada um
+def etapa_importacoes():
+    tempos = {}
+    for modulo in MODULOS_PAINEL + MODULOS_SOB_DEMANDA:
+        inicio = time.perf_counter()
+        importlib.import_module(modulo)
+        tempos[modulo] = time.perf_counter() - inicio
+    return tempos
+
+
+# Etapa: carrega a base lendo o arquivo original (sem cache) ou o cache já preparado
+def etapa_carga(usar_cache):
+    from consultas import carregar_dados
+
+    inicio = time.perf_counter()
+    df = carregar_dados(usar_cache=usar_cache)
+    return {
+        "segundos": time.perf_counter() - inicio,
+        "linhas": len(df),
+        "openpyxl_importado": "openpyxl" in sys.modules,
+    }
+
+
+# Etapa: executa o script do painel na primeira visita de um usuário e em uma nova execução
+def etapa_primeira_renderizacao():
+    inicio = time.perf_counter()
+    from streamlit.testing.v1 import AppTest
+    importacao = time.perf_counter() - inicio
+
+    app = AppTest.from_file(os.path.join(PASTA, "index.py"), default_timeout=300)
+    inicio = time.perf_counter()
+    app.run()
+    primeira = time.perf_counter() - inicio
+    inicio = time.perf_counter()
+    app.run()
+    segunda = time.perf_counter() - inicio
+    return {"importacao_apptest": importacao, "primeira_execucao": primeira, "segunda_execucao": segunda,
+            "erros": len(app.exception)}
+
+
+ETAPAS = {
+    "importacoes": etapa_importacoes,
+    "carga_original": lambda: etapa_carga(usar_cache=False),
+    "carga_cache": lambda: etapa_carga(usar_cache=True),
+    "primeira_renderizacao": etapa_primeira_renderizacao,
+}
+
+
+# Função para rodar uma etapa em um processo novo (como um worker recém-criado)
+def medir_em_processo_novo(etapa):
+    inicio = time.perf_counter()
+    saida = subprocess.run([sys.executable, os.path.abspath(__file__), "--etapa", etapa],
+                           cwd=PASTA, capture_output=True, text=True, check=True).stdout
+    resultado = json.loads(saida.strip().splitlines()[-1])
+    resultado["processo_total"] = time.perf_counter() - inicio
+    return resultado
+
+
+def imprimir_relatorio(resultados):
+    print("== Importação dos módulos (custo adicional, na ordem do painel) ==")
+    importacoes = resultados["importacoes"]
+    for modulo in MODULOS_PAINEL:
+        print(f"  {modulo:<28} {importacoes[modulo] * 1000:9.1f} ms")
+    print(f"  {'total':<28} {sum(importacoes[m] for m in MODULOS_PAINEL) * 1000:9.1f} ms")
+    if MODULOS_SOB_DEMANDA:
+        print("== Importados sob demanda (fora da inicialização) ==")
+        for modulo in MODULOS_SOB_DEMANDA:
+            print(f"  {modulo:<28} {importacoes[modulo] * 1000:9.1f} ms")
+
+    print("== Carga dos dados ==")
+    for etapa, rotulo in [("carga_original", "arquivo original"), ("carga_cache", "cache preparado")]:
+        carga = resultados[etapa]
+        print(f"  {rotulo:<28} {carga['segundos'] * 1000:9.1f} ms  "
+              f"({carga['linhas']} linhas, openpyxl importado: {'sim' if carga['openpyxl_importado'] else 'não'})")
+
+    if "primeira_renderizacao" in resultados:
+        render = resultados["primeira_renderizacao"]
+        print("== Renderização do painel ==")
+        print(f"  {'importação do AppTest':<28} {render['importacao_apptest'] * 1000:9.1f} ms")
+        print(f"  {'primeira execução':<28} {render['primeira_execucao'] * 1000:9.1f} ms")
+        print(f"  {'execução seguinte':<28} {render['segunda_execucao'] * 1000:9.1f} ms")
+        print(f"  {'processo completo':<28} {render['processo_total'] * 1000:9.1f} ms  (erros: {render['erros']})")
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Mede o tempo de inicialização do painel.")
+    parser.add_argument("--etapa", choices=list(ETAPAS), help=argparse.SUPPRESS)
+    parser.add_argument("--sem-renderizacao", action="store_true", help="não mede a execução do painel")
+    parser.add_argument("--json", action="store_true", help="imprime o resultado em JSON")
+    args = parser.parse_args(argv)
+
+    if args.etapa:
+        # Execução interna, em processo novo: imprime o resultado da etapa em JSON
+        print(json.dumps(ETAPAS[args.etapa]()))
+        return
+
+    # Garante que o cache exista antes de medir a carga a partir dele
+    from consultas import carregar_dados
+    carregar_dados()
+
+    etapas = [e for e in ETAPAS if not (args.sem_renderizacao and e == "primeira_renderizacao")]
+    resultados = {etapa: medir_em_processo_novo(etapa) for etapa in etapas}
+    if args.json:
+        print(json.dumps(resultados, indent=2))
+    else:
+        imprimir_relatorio(resultados)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,157 @@
+import argparse
+import html
+import itertools
+import os
+import re
+import time
+from multiprocessing import Pool
+
+from consultas import (ARQUIVO_DADOS, FILTROS, cargos_em_alta, carregar_dados, em_alta_por_setor,
+                       estatisticas_cargos, filtrar_dados, filtros_cubo, media_salarial, progressao_niveis,
+                       salarios_por_porte, top_areas)
+from distribuicao import BORDAS_SALARIO, agregar_cubo, fatiar_cubo, montar_cubo, resumo_boxplot
+from graficos import (grafico_boxplot, grafico_em_alta_setor, grafico_especialidade_setor,
+                      grafico_especialidades, grafico_histograma, grafico_media_setor, grafico_progressao,
+                      grafico_regional, grafico_setor_area, grafico_top_areas)
+
+
+# Dimensões percorridas na geração dos relatórios
+DIMENSOES_RELATORIO = ["setor", "regiao", "empresa"]
+
+ESTILO = """
+body { font-family: sans-serif; margin: 2em; }
+table { border-collapse: collapse; font-size: 0.85em; }
+th, td { border: 1px solid #ccc; padding: 4px 8px; }
+th { background: #f0f0f0; }
+"""
+
+# Dados preparados e cubo de cada processo (recebidos uma única vez, na criação do processo)
+_df = None
+_cubo = None
+
+
+# Função para inicializar cada processo com os dados já preparados
+def iniciar_processo(df, cubo):
+    global _df, _cubo
+    _df, _cubo = df, cubo
+
+
+# Função para listar todas as combinações de setor, região e porte (incluindo "Todos"/"Todas")
+def listar_combinacoes(df):
+    opcoes = [[FILTROS[coluna]] + list(df[coluna].dropna().unique()) for coluna in DIMENSOES_RELATORIO]
+    return list(itertools.product(*opcoes))
+
+
+# Função para montar o nome do arquivo do relatório a partir dos filtros
+def nome_arquivo(combinacao):
+    partes = [re.sub(r"[^0-9A-Za-z]+", "-", str(valor)).strip("-") for valor in combinacao]
+    return "relatorio_" + "_".join(partes) + ".html"
+
+
+# Função para converter uma figura em HTML (o plotly.js vai só na primeira figura do arquivo)
+def figura_html(fig, incluir_plotlyjs):
+    return fig.to_html(full_html=False, include_plotlyjs=incluir_plotlyjs)
+
+
+# Função para montar o HTML com as mesmas saídas das abas 1 e 2 do painel
+def montar_relatorio(combinacao, plotlyjs="inline"):
+    escolhas = dict(zip(DIMENSOES_RELATORIO, combinacao))
+    filtered_df = filtrar_dados(_df, **escolhas)
+    if filtered_df.empty:
+        return None
+
+    cubo_filtrado = fatiar_cubo(_cubo, **filtros_cubo(**escolhas))
+    titulo = "Relatório - " + " | ".join(f"{coluna}: {valor}" for coluna, valor in escolhas.items())
+
+    figuras = [
+        grafico_media_setor(media_salarial(filtered_df, "setor")),
+        grafico_setor_area(media_salarial(filtered_df, ["setor", "area"])),
+        grafico_especialidade_setor(media_salarial(filtered_df, ["especialidade", "setor"])),
+        grafico_top_areas(top_areas(filtered_df)),
+        grafico_em_alta_setor(em_alta_por_setor(filtered_df)),
+    ]
+    if len(cubo_filtrado):
+        resumo_box = resumo_boxplot(agregar_cubo(cubo_filtrado, por=["nivel", "empresa"]), BORDAS_SALARIO).reset_index()
+        figuras.append(grafico_boxplot(resumo_box, "nivel", "Nível",
+                                       "Distribuição Salarial por Nível e Porte da Empresa"))
+        contagens = agregar_cubo(cubo_filtrado).drop(columns=["minimo", "maximo"]).iloc[0].to_numpy(dtype=float)
+        figuras.append(grafico_histograma(contagens, BORDAS_SALARIO))
+    figuras.append(grafico_progressao(progressao_niveis(filtered_df)))
+    if filtered_df["regiao"].notna().any():
+        figuras.append(grafico_regional(media_salarial(filtered_df, "regiao")))
+    if filtered_df["especialidade"].notna().any():
+        spec_avg = media_salarial(filtered_df, "especialidade").sort_values("salario", ascending=False)
+        figuras.append(grafico_especialidades(spec_avg))
+
+    incluir = "cdn" if plotlyjs == "cdn" else True
+    graficos_html = [figura_html(fig, incluir if i == 0 else False) for i, fig in enumerate(figuras)]
+
+    em_alta = cargos_em_alta(filtered_df)
+    tabela_cargos = estatisticas_cargos(filtered_df).sort_values("Média Salarial", ascending=False)
+    insights = f"""
+    <ul>
+      <li>Média Salarial: R$ {filtered_df["salario"].mean():,.2f}</li>
+      <li>Número de Cargos Diferentes: {filtered_df["cargo"].nunique()}</li>
+      <li>Cargos em Alta: {len(em_alta)}</li>
+    </ul>"""
+
+    return f"""<!DOCTYPE html>
+<html lang="pt-br">
+<head><meta charset="utf-8"><title>{html.escape(titulo)}</title><style>{ESTILO}</style></head>
+<body>
+<h1>{html.escape(titulo)}</h1>
+<h2>Insights</h2>{insights}
+<h2>Gráficos</h2>
+{"".join(graficos_html)}
+<h2>Salários por Porte de Empresa</h2>
+{salarios_por_porte(filtered_df).round(2).to_html(index=False, na_rep="")}
+<h2>Cargos e Salários</h2>
+{tabela_cargos.round(2).to_html(index=False, na_rep="")}
+</body>
+</html>
+"""
+
+
+# Função executada em cada processo: gera e grava um relatório
+def gerar_relatorio(tarefa):
+    combinacao, pasta_saida, plotlyjs = tarefa
+    conteudo = montar_relatorio(combinacao, plotlyjs)
+    if conteudo is None:
+        return None
+    caminho = os.path.join(pasta_saida, nome_arquivo(combinacao))
+    with open(caminho, "w", encoding="utf-8") as arquivo:
+        arquivo.write(conteudo)
+    return caminho
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Gera relatórios HTML estáticos por setor, região e porte de empresa.")
+    parser.add_argument("--arquivo", default=ARQUIVO_DADOS, help="nome base do arquivo de dados (CSV ou XLSX)")
+    parser.add_argument("--saida", default="relatorios", help="pasta onde os relatórios serão gravados")
+    parser.add_argument("--processos", type=int, default=os.cpu_count(), help="quantidade de processos em paralelo")
+    parser.add_argument("--plotlyjs", choices=["inline", "cdn"], default="inline",
+                        help="embutir o plotly.js em cada arquivo (inline) ou carregá-lo da CDN")
+    args = parser.parse_args(argv)
+
+    inicio = time.perf_counter()
+    df = carregar_dados(args.arquivo)
+    if df.empty:
+        parser.error("Arquivo de dados não encontrado. Certifique-se de que o arquivo CSV ou XLSX está na pasta.")
+    cubo = montar_cubo(df, BORDAS_SALARIO)
+
+    os.makedirs(args.saida, exist_ok=True)
+    tarefas = [(combinacao, args.saida, args.plotlyjs) for combinacao in listar_combinacoes(df)]
+
+    gerados = 0
+    with Pool(args.processos, initializer=iniciar_processo, initargs=(df, cubo)) as pool:
+        for caminho in pool.imap_unordered(gerar_relatorio, tarefas):
+            if caminho is not None:
+                gerados += 1
+                print(caminho)
+
+    print(f"{gerados} relatórios gerados em {time.perf_counter() - inicio:.1f}s "
+          f"({len(tarefas) - gerados} combinações sem dados)")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,131 @@
+import numpy as np
+import pandas as pd
+from scipy import sparse
+
+from consultas import ORDEM_NIVEIS
+
+
+# Quantidade de vizinhos guardados por cargo no índice
+VIZINHOS_POR_CARGO = 20
+
+# Candidatos por habilidades avaliados antes de aplicar salário e nível
+CANDIDATOS_POR_CARGO = 100
+
+# Penalidades na pontuação final: diferença de salário (em log) e de nível de carreira
+PESO_SALARIO = 0.15
+PESO_NIVEL = 0.10
+
+# Linhas processadas por vez no produto esparso (limita a memória com muitos cargos)
+TAMANHO_BLOCO = 256
+
+
+# Função para separar as habilidades de cada vaga (minúsculas, sem espaços e sem "não informadas").
+# Vagas sem cargo ficam de fora: não têm linha na matriz de cargos.
+def habilidades_por_vaga(df):
+    vagas = df.loc[df["cargo"].notna() & df["habilidade"].notna(), ["cargo", "habilidade"]]
+    explodido = vagas.assign(habilidade=vagas["habilidade"].str.split(",")).explode("habilidade")
+    explodido["habilidade"] = explodido["habilidade"].str.strip().str.lower()
+    validas = explodido["habilidade"].ne("") & explodido["habilidade"].ne("não informadas")
+    return explodido[validas]
+
+
+# Função para montar a matriz TF-IDF (cargos x habilidades), com linhas de norma 1
+def matriz_tfidf(df, cargos):
+    explodido = habilidades_por_vaga(df)
+    linhas = pd.Categorical(explodido["cargo"], categories=cargos).codes
+    colunas, habilidades = pd.factorize(explodido["habilidade"])
+    contagens = sparse.csr_matrix((np.ones(len(linhas)), (linhas, colunas)),
+                                  shape=(len(cargos), len(habilidades)))
+    contagens.sum_duplicates()
+
+    # TF com log (atenua habilidades repetidas em muitas vagas do mesmo cargo) e IDF suavizado
+    tf = contagens.copy()
+    tf.data = 1 + np.log(tf.data)
+    frequencia_documentos = np.bincount(contagens.indices, minlength=len(habilidades))
+    idf = np.log((1 + len(cargos)) / (1 + frequencia_documentos)) + 1
+    tfidf = tf @ sparse.diags(idf)
+
+    normas = np.sqrt(np.asarray(tfidf.multiply(tfidf).sum(axis=1)).ravel())
+    normas[normas == 0] = 1
+    return sparse.csr_matrix(sparse.diags(1 / normas) @ tfidf), np.asarray(habilidades)
+
+
+# Função para montar o índice de cargos parecidos. Calcula uma vez, para todos os cargos, os
+# vizinhos mais próximos (similaridade de habilidades ajustada por salário e nível).
+def montar_indice_similaridade(df, vizinhos=VIZINHOS_POR_CARGO):
+    cargos = df["cargo"].cat.categories if isinstance(df["cargo"].dtype, pd.CategoricalDtype) \
+        else pd.Index(df["cargo"].dropna().unique())
+    matriz, habilidades = matriz_tfidf(df, cargos)
+
+    por_cargo = df.groupby(pd.Categorical(df["cargo"], categories=cargos), observed=False)
+    salario = por_cargo["salario"].median().to_numpy()
+    nivel = por_cargo["nivel"].first().astype(object).to_numpy()
+    ordem = {n: i for i, n in enumerate(ORDEM_NIVEIS) if n != "Outros"}
+    nivel_ordinal = np.array([ordem.get(n, np.nan) for n in nivel], dtype=float)
+    log_salario = np.log(salario)
+
+    n = len(cargos)
+    candidatos = min(CANDIDATOS_POR_CARGO, max(n - 1, 1))
+    k = min(vizinhos, max(n - 1, 1))
+    indices_vizinhos = np.zeros((n, k), dtype=np.int32)
+    pontuacoes = np.full((n, k), -np.inf)
+    similaridades = np.zeros((n, k))
+
+    for inicio in range(0, n, TAMANHO_BLOCO):
+        fim = min(inicio + TAMANHO_BLOCO, n)
+        bloco = (matriz[inicio:fim] @ matriz.T).toarray()
+        bloco[np.arange(fim - inicio), np.arange(inicio, fim)] = -1  # o próprio cargo não conta
+
+        # Pré-seleção pelos melhores candidatos de habilidades
+        melhores = np.argpartition(-bloco, candidatos - 1, axis=1)[:, :candidatos]
+        sim = np.take_along_axis(bloco, melhores, axis=1)
+
+        # Ajuste por salário e nível (quando conhecidos nos dois cargos)
+        dif_salario = np.abs(log_salario[melhores] - log_salario[inicio:fim, None])
+        dif_nivel = np.abs(nivel_ordinal[melhores] - nivel_ordinal[inicio:fim, None]) / (len(ordem) - 1)
+        pontuacao = sim - PESO_SALARIO * np.nan_to_num(dif_salario) - PESO_NIVEL * np.nan_to_num(dif_nivel)
+        pontuacao[sim <= 0] = -np.inf  # sem nenhuma habilidade em comum
+
+        ordem_final = np.argsort(-pontuacao, axis=1)[:, :k]
+        indices_vizinhos[inicio:fim] = np.take_along_axis(melhores, ordem_final, axis=1)
+        pontuacoes[inicio:fim] = np.take_along_axis(pontuacao, ordem_final, axis=1)
+        similaridades[inicio:fim] = np.take_along_axis(sim, ordem_final, axis=1)
+
+    return {
+        "cargos": pd.Index(cargos),
+        "matriz": matriz,
+        "habilidades": habilidades,
+        "salario": salario,
+        "nivel": nivel,
+        "vizinhos": indices_vizinhos,
+        "pontuacoes": pontuacoes,
+        "similaridades": similaridades,
+    }
+
+
+# Função para listar as habilidades em comum entre dois cargos (as de maior peso primeiro)
+def habilidades_em_comum(indice, i, j, limite=5):
+    matriz = indice["matriz"]
+    linha_i, linha_j = matriz.getrow(i), matriz.getrow(j)
+    comuns, pos_i, pos_j = np.intersect1d(linha_i.indices, linha_j.indices, return_indices=True)
+    pesos = linha_i.data[pos_i] * linha_j.data[pos_j]
+    return [indice["habilidades"][h] for h in comuns[np.argsort(-pesos)][:limite]]
+
+
+# Função para consultar os cargos mais parecidos com um cargo (leitura direta do índice)
+def cargos_parecidos(indice, cargo, k=10):
+    if cargo not in indice["cargos"]:
+        return pd.DataFrame(columns=["Cargo", "Similaridade", "Nível", "Salário Mediano",
+                                     "Diferença Salarial", "Habilidades em Comum"])
+    i = indice["cargos"].get_loc(cargo)
+    validos = np.isfinite(indice["pontuacoes"][i])
+    vizinhos = indice["vizinhos"][i][validos][:k]
+    salario = indice["salario"]
+    return pd.DataFrame({
+        "Cargo": indice["cargos"][vizinhos],
+        "Similaridade": indice["similaridades"][i][validos][:k].round(3),
+        "Nível": indice["nivel"][vizinhos],
+        "Salário Mediano": salario[vizinhos].round(2),
+        "Diferença Salarial": (salario[vizinhos] - salario[i]).round(2),
+        "Habilidades em Comum": [", ".join(habilidades_em_comum(indice, i, j)) for j in vizinhos],
+    })
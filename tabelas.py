@@ -0,0 +1,89 @@
+import math
+
+import numpy as np
+import pandas as pd
+import streamlit as st
+
+
+# Quantidade padrão de linhas enviadas ao navegador por página
+TAMANHO_PAGINA = 50
+
+
+# Função para calcular a ordem das linhas de uma tabela
+def ordenar_linhas(tabela, coluna, crescente):
+    ordenada = tabela.reset_index(drop=True).sort_values(
+        coluna, ascending=crescente, kind="stable", na_position="last"
+    )
+    return ordenada.index.to_numpy()
+
+
+# Função para guardar a ordem já calculada. A chave é a tabela (chave e filtros que a geraram),
+# a coluna e a direção; a tabela em si (_tabela) não é hasheada a cada execução.
+@st.cache_data(max_entries=64)
+def calcular_ordem(_tabela, chave, chave_dados, coluna, crescente):
+    return ordenar_linhas(_tabela, coluna, crescente)
+
+
+# Função para voltar à primeira página quando a busca ou a ordenação mudam
+def voltar_primeira_pagina(chave_pagina):
+    st.session_state[chave_pagina] = 1
+
+
+# Função para buscar um termo em uma coluna de texto (sem diferenciar maiúsculas)
+def buscar_termo(serie, termo):
+    if isinstance(serie.dtype, pd.CategoricalDtype):
+        # Em colunas categóricas a busca é feita só nas categorias distintas
+        categorias = serie.cat.categories.astype(str)
+        codigos = np.flatnonzero(categorias.str.contains(termo, case=False, regex=False))
+        return serie.cat.codes.isin(codigos).to_numpy()
+    return serie.astype(str).str.contains(termo, case=False, regex=False, na=False).to_numpy()
+
+
+# Função para exibir uma tabela paginada: busca e ordenação são feitas no servidor
+# e apenas as linhas da página atual são enviadas ao navegador. `chave_dados` identifica o
+# conteúdo da tabela (versão da base e filtros); com ela, a ordem das linhas fica em cache.
+def exibir_tabela_paginada(tabela, chave, coluna_busca=None, ordenar_por=None, crescente=False,
+                           tamanho_pagina=TAMANHO_PAGINA, chave_dados=None):
+    tabela = tabela.reset_index(drop=True)
+    colunas = list(tabela.columns)
+    chave_pagina = f"{chave}_pagina"
+
+    col_busca, col_ordem, col_direcao = st.columns([2, 1, 1])
+    with col_busca:
+        termo = ""
+        if coluna_busca is not None:
+            termo = st.text_input(f"Buscar por {coluna_busca}", key=f"{chave}_busca",
+                                  on_change=voltar_primeira_pagina, args=(chave_pagina,)).strip()
+    with col_ordem:
+        indice_padrao = colunas.index(ordenar_por) if ordenar_por in colunas else 0
+        coluna_ordem = st.selectbox("Ordenar por", colunas, index=indice_padrao, key=f"{chave}_ordem",
+                                    on_change=voltar_primeira_pagina, args=(chave_pagina,))
+    with col_direcao:
+        direcao = st.selectbox("Direção", ["Decrescente", "Crescente"],
+                               index=1 if crescente else 0, key=f"{chave}_direcao",
+                               on_change=voltar_primeira_pagina, args=(chave_pagina,))
+
+    if chave_dados is None:
+        posicoes = ordenar_linhas(tabela, coluna_ordem, direcao == "Crescente")
+    else:
+        posicoes = calcular_ordem(tabela, chave, chave_dados, coluna_ordem, direcao == "Crescente")
+    if termo and coluna_busca is not None:
+        encontrados = buscar_termo(tabela[coluna_busca], termo)
+        posicoes = posicoes[encontrados[posicoes]]
+
+    total = len(posicoes)
+    total_paginas = max(1, math.ceil(total / tamanho_pagina))
+
+    # Volta para a última página válida quando filtros reduzem o resultado
+    if st.session_state.get(chave_pagina, 1) > total_paginas:
+        st.session_state[chave_pagina] = total_paginas
+
+    inicio = (st.session_state.get(chave_pagina, 1) - 1) * tamanho_pagina
+    st.dataframe(tabela.iloc[posicoes[inicio:inicio + tamanho_pagina]], use_container_width=True, hide_index=True)
+
+    col_pagina, col_info = st.columns([1, 3])
+    with col_pagina:
+        st.number_input("Página", min_value=1, max_value=total_paginas, step=1, key=chave_pagina)
+    with col_info:
+        fim = min(inicio + tamanho_pagina, total)
+        st.caption(f"Mostrando {inicio + 1 if total else 0}–{fim} de {total} linhas")
@@ -0,0 +1,119 @@
+import numpy as np
+import pandas as pd
+
+from distribuicao import colunas_faixas, montar_cubo, quantis_histograma
+
+
+# Frequências disponíveis para os baldes de tempo (rótulo -> código de período do pandas)
+FREQUENCIAS = {"Semanal": "W", "Mensal": "M"}
+
+# Quantos períodos equivalem a um ano em cada frequência (comparação ano contra ano)
+PERIODOS_POR_ANO = {"W": 52, "M": 12}
+
+# Dimensões guardadas em cada balde
+DIMENSOES_TENDENCIA = ["setor", "cargo", "regiao"]
+
+# Colunas que definem em qual balde (e em qual faixa) cada vaga entra
+COLUNAS_BALDE = ["id", "created_at", "ano", "salario"] + DIMENSOES_TENDENCIA
+
+
+# Função para definir o período de cada vaga: data de criação ou, sem ela, o início do ano
+def periodo_das_vagas(df, frequencia):
+    data = df["created_at"]
+    if "ano" in df.columns:
+        inicio_ano = pd.to_datetime(df["ano"].astype("Int64").astype("string") + "-01-01", errors="coerce")
+        data = data.fillna(inicio_ano)
+    return data.dt.to_period(frequencia).dt.start_time
+
+
+# Função para montar os baldes de tempo: por período e dimensão, a quantidade de vagas e o
+# histograma salarial nas mesmas faixas fixas do cubo (BORDAS_SALARIO; por isso os baldes
+# podem ser somados)
+def montar_baldes(df, bordas, frequencia):
+    dados = df.assign(periodo=periodo_das_vagas(df, frequencia)).dropna(subset=["periodo"])
+    chaves = ["periodo"] + DIMENSOES_TENDENCIA
+    vagas = dados.groupby(chaves, observed=True, dropna=False).size().rename("vagas").to_frame()
+    histogramas = montar_cubo(dados, bordas, chaves)
+    baldes = vagas.join(histogramas, how="left")
+    faixas = colunas_faixas(baldes)
+    return pd.concat([baldes.drop(columns=faixas), baldes[faixas].fillna(0).astype(np.int32)], axis=1)
+
+
+# Função para juntar baldes já existentes com os de novas vagas, sem reprocessar a base inteira
+def atualizar_baldes(baldes, novas_vagas, bordas, frequencia):
+    novos = montar_baldes(novas_vagas, bordas, frequencia)
+    juntos = pd.concat([baldes, novos])
+    faixas = colunas_faixas(juntos)
+    grupos = juntos.groupby(level=list(juntos.index.names), observed=True, dropna=False)
+    return pd.concat([grupos["vagas"].sum(), grupos["minimo"].min(), grupos["maximo"].max(),
+                      grupos[faixas].sum().astype(np.int32)], axis=1)
+
+
+# Função para encontrar as vagas novas de uma base em relação à anterior. Retorna None quando os
+# baldes precisam ser refeitos: vagas sem id, vagas removidas ou vagas antigas alteradas.
+def vagas_novas(anterior, atual):
+    if anterior is None or any(c not in anterior.columns or c not in atual.columns for c in COLUNAS_BALDE):
+        return None
+    if anterior["id"].isna().any() or atual["id"].isna().any() or not atual["id"].is_unique:
+        return None
+
+    def assinatura(df):
+        colunas = df[COLUNAS_BALDE].astype({c: object for c in DIMENSOES_TENDENCIA})
+        return pd.Series(pd.util.hash_pandas_object(colunas, index=False).to_numpy(), index=df["id"].to_numpy())
+
+    antes, depois = assinatura(anterior), assinatura(atual)
+    if not antes.index.isin(depois.index).all() or (depois.reindex(antes.index) != antes).any():
+        return None
+    return atual[~atual["id"].isin(antes.index)]
+
+
+# Função para gravar os baldes em Parquet (os nomes das faixas viram texto)
+def gravar_baldes(baldes, caminho):
+    tabela = baldes.reset_index()
+    tabela.columns = [str(c) for c in tabela.columns]
+    tabela.to_parquet(caminho, index=False)
+
+
+# Função para ler baldes gravados (None se o arquivo não existir ou não puder ser lido)
+def ler_baldes(caminho):
+    try:
+        tabela = pd.read_parquet(caminho)
+    except (ImportError, OSError, ValueError):
+        return None
+    tabela.columns = [int(c) if c.isdigit() else c for c in tabela.columns]
+    return tabela.set_index(["periodo"] + DIMENSOES_TENDENCIA)
+
+
+# Função para montar a série temporal de uma seleção: vagas e mediana salarial por período,
+# com janela móvel e variação contra o mesmo período do ano anterior (tudo a partir dos baldes)
+def serie_temporal(baldes, bordas, frequencia, janela=1, **filtros):
+    mascara = np.ones(len(baldes), dtype=bool)
+    for dimensao, valor in filtros.items():
+        if valor is not None:
+            mascara &= (baldes.index.get_level_values(dimensao) == valor)
+    selecao = baldes[mascara]
+
+    faixas = colunas_faixas(baldes)
+    por_periodo = selecao.groupby(level="periodo")[["vagas"] + faixas].sum()
+    if por_periodo.empty:
+        return pd.DataFrame(columns=["periodo", "vagas", "mediana", "vagas_variacao_anual",
+                                     "mediana_variacao_anual"])
+
+    # Períodos sem vagas entram com zero, para que janelas e comparações anuais fiquem alinhadas
+    periodos = pd.period_range(por_periodo.index.min(), por_periodo.index.max(), freq=frequencia).start_time
+    por_periodo = por_periodo.reindex(periodos, fill_value=0)
+
+    # Janela móvel: soma das vagas e dos histogramas dos últimos `janela` períodos
+    if janela > 1:
+        por_periodo = por_periodo.rolling(janela, min_periods=1).sum()
+
+    contagens = por_periodo[faixas].to_numpy()
+    mediana = quantis_histograma(contagens, bordas, [0.5])[0.5]
+    mediana = np.where(contagens.sum(axis=1) > 0, mediana, np.nan)
+
+    serie = pd.DataFrame({"periodo": por_periodo.index, "vagas": por_periodo["vagas"].to_numpy(),
+                          "mediana": mediana})
+    defasagem = PERIODOS_POR_ANO[frequencia]
+    serie["vagas_variacao_anual"] = serie["vagas"] / serie["vagas"].shift(defasagem).replace(0, np.nan) - 1
+    serie["mediana_variacao_anual"] = serie["mediana"] / serie["mediana"].shift(defasagem) - 1
+    return serie
@@ -0,0 +1,175 @@
+import argparse
+import json
+import os
+import random
+import resource
+import subprocess
+import sys
+import threading
+import time
+
+import numpy as np
+
+
+PASTA = os.path.dirname(os.path.abspath(__file__))
+
+# Seletores que um usuário típico troca ao navegar pelo painel
+ROTEIRO_SELETORES = [
+    "Escolha um setor",
+    "Escolha uma área",
+    "Escolha uma região",
+    "Porte da empresa",
+    "Escolha um cargo para visualizar as habilidades",
+    "Escolha um cargo:",
+]
+
+
+# Função para ler a memória residente atual do processo (em MB)
+def memoria_mb():
+    try:
+        with open("/proc/self/status") as status:
+            for linha in status:
+                if linha.startswith("VmRSS:"):
+                    return int(linha.split()[1]) / 1024
+    except OSError:
+        pass
+    # Fora do Linux: pico de memória do processo (ru_maxrss é em KB no Linux e em bytes no macOS)
+    pico = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    return pico / (1024 * 1024) if sys.platform == "darwin" else pico / 1024
+
+
+# Função que simula um usuário: abre o painel e troca filtros aleatoriamente, medindo o tempo
+# da primeira execução (separado) e de cada reexecução do script
+def simular_sessao(cliques, semente, pausa, primeiras, latencias, erros):
+    from streamlit.testing.v1 import AppTest
+
+    rng = random.Random(semente)
+    try:
+        app = AppTest.from_file(os.path.join(PASTA, "index.py"), default_timeout=600)
+        inicio = time.perf_counter()
+        app.run()
+        primeiras.append(time.perf_counter() - inicio)
+        if app.exception:
+            erros.append(str(app.exception[0].message))
+
+        for _ in range(cliques):
+            if pausa:
+                time.sleep(rng.uniform(0, 2 * pausa))
+            rotulo = rng.choice(ROTEIRO_SELETORES)
+            seletor = next((s for s in app.selectbox if s.label == rotulo), None)
+            if seletor is None or not seletor.options:
+                continue
+            seletor.set_value(rng.choice(seletor.options))
+            inicio = time.perf_counter()
+            app.run()
+            latencias.append(time.perf_counter() - inicio)
+            if app.exception:
+                erros.append(str(app.exception[0].message))
+    except Exception as erro:  # Ex.: tempo esgotado no AppTest; a sessão para, mas o erro é contado
+        erros.append(f"{type(erro).__name__}: {erro}")
+
+
+# Função executada em cada processo: roda várias sessões simultâneas em threads,
+# como o servidor do Streamlit faz com os usuários conectados
+def rodar_processo(sessoes, cliques, semente, pausa):
+    primeiras, latencias, erros = [], [], []
+    threads = [threading.Thread(target=simular_sessao,
+                                args=(cliques, semente + i, pausa, primeiras, latencias, erros))
+               for i in range(sessoes)]
+    inicio = time.perf_counter()
+    for thread in threads:
+        thread.start()
+    pico_memoria = memoria_mb()
+    while any(thread.is_alive() for thread in threads):
+        time.sleep(0.2)
+        pico_memoria = max(pico_memoria, memoria_mb())
+    for thread in threads:
+        thread.join()
+    return {"primeiras": primeiras, "latencias": latencias, "erros": erros, "duracao": time.perf_counter() - inicio,
+            "memoria_mb": pico_memoria}
+
+
+# Função para ler o resultado de um processo de teste (falha com a saída de erro se ele quebrar)
+def ler_resultado(execucao):
+    saida, erro = execucao.communicate()
+    linhas = saida.strip().splitlines()
+    if execucao.returncode != 0 or not linhas:
+        raise RuntimeError(f"Processo de teste falhou (código {execucao.returncode}):\n{erro.strip()}")
+    return json.loads(linhas[-1])
+
+
+# Função para medir um cenário: `sessoes` usuários divididos entre `processos` processos novos
+def medir_cenario(sessoes, processos, cliques, semente, pausa):
+    por_processo = [sessoes // processos + (1 if i < sessoes % processos else 0) for i in range(processos)]
+    inicio = time.perf_counter()
+    execucoes = [
+        subprocess.Popen([sys.executable, os.path.abspath(__file__), "--processo-interno",
+                          "--sessoes", str(n), "--cliques", str(cliques), "--semente", str(semente + 1000 * i),
+                          "--pausa", str(pausa)],
+                         cwd=PASTA, stdout=subprocess.PIPE, stderr=subprocess.PIPE, text=True)
+        for i, n in enumerate(por_processo) if n > 0
+    ]
+    resultados = [ler_resultado(execucao) for execucao in execucoes]
+    duracao = time.perf_counter() - inicio
+
+    latencias = np.array([latencia for resultado in resultados for latencia in resultado["latencias"]])
+    p50, p90, p99 = np.percentile(latencias, [50, 90, 99]) if len(latencias) else (np.nan,) * 3
+    primeiras = np.array([tempo for resultado in resultados for tempo in resultado["primeiras"]])
+    primeira_p50, primeira_max = (np.median(primeiras), primeiras.max()) if len(primeiras) else (np.nan,) * 2
+    return {
+        "sessoes": sessoes,
+        "processos": len(resultados),
+        "reexecucoes": len(latencias),
+        "erros": sum(len(resultado["erros"]) for resultado in resultados),
+        "vazao": len(latencias) / duracao,
+        "p50_ms": p50 * 1000,
+        "p90_ms": p90 * 1000,
+        "p99_ms": p99 * 1000,
+        "primeira_p50_ms": primeira_p50 * 1000,
+        "primeira_max_ms": primeira_max * 1000,
+        "memoria_max_mb": max(resultado["memoria_mb"] for resultado in resultados),
+    }
+
+
+def imprimir_cabecalho():
+    print(f"{'sessões':>8} {'proc.':>6} {'reexec.':>8} {'erros':>6} {'vazão/s':>8} "
+          f"{'p50 ms':>9} {'p90 ms':>9} {'p99 ms':>9} {'1ª p50 ms':>10} {'1ª máx ms':>10} {'RAM/proc MB':>12}")
+
+
+def imprimir_cenario(c):
+    print(f"{c['sessoes']:>8} {c['processos']:>6} {c['reexecucoes']:>8} {c['erros']:>6} {c['vazao']:>8.2f} "
+          f"{c['p50_ms']:>9.0f} {c['p90_ms']:>9.0f} {c['p99_ms']:>9.0f} {c['primeira_p50_ms']:>10.0f} "
+          f"{c['primeira_max_ms']:>10.0f} {c['memoria_max_mb']:>12.0f}", flush=True)
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(
+        description="Teste de carga do painel: simula sessões simultâneas trocando filtros (via AppTest).")
+    parser.add_argument("--sessoes", type=int, nargs="+", default=[1, 2, 4, 8],
+                        help="quantidades de sessões simultâneas a medir")
+    parser.add_argument("--processos", type=int, default=1, help="processos do servidor entre os quais as sessões são divididas")
+    parser.add_argument("--cliques", type=int, default=10, help="trocas de filtro por sessão")
+    parser.add_argument("--pausa", type=float, default=0.0, help="tempo médio de espera entre cliques, em segundos")
+    parser.add_argument("--semente", type=int, default=42)
+    parser.add_argument("--json", action="store_true", help="imprime o resultado em JSON")
+    parser.add_argument("--processo-interno", action="store_true", help=argparse.SUPPRESS)
+    args = parser.parse_args(argv)
+
+    if args.processo_interno:
+        print(json.dumps(rodar_processo(args.sessoes[0], args.cliques, args.semente, args.pausa)))
+        return
+
+    # Cada cenário roda em processos novos, para que cache e memória partam do zero
+    cenarios = []
+    if not args.json:
+        imprimir_cabecalho()
+    for sessoes in args.sessoes:
+        cenarios.append(medir_cenario(sessoes, min(args.processos, sessoes), args.cliques, args.semente, args.pausa))
+        if not args.json:
+            imprimir_cenario(cenarios[-1])
+    if args.json:
+        print(json.dumps(cenarios, indent=2))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,161 @@
+import numpy as np
+import pandas as pd
+
+
+# Esquema esperado da base: coluna -> tipo
+ESQUEMA = {
+    "id": "inteiro",
+    "cargo": "texto",
+    "senioridade": "texto",
+    "setor": "texto",
+    "salario": "salario",
+    "regiao": "texto",
+    "empresa": "texto",
+    "modalidade": "texto",
+    "created_at": "data",
+    "updated_at": "data",
+    "ano": "inteiro",
+    "em_alta": "texto",
+    "area": "texto",
+    "especialidade": "texto",
+    "habilidade": "texto",
+}
+
+# Textos que significam "sem valor" nas planilhas e CSVs de origem
+MARCADORES_AUSENTES = ["", "não informado", "nao informado", "null", "none", "nan", "n/a", "-"]
+
+# Portes de empresa aceitos (a legenda do painel usa pq/md/gr)
+PORTES_EMPRESA = ["pq", "md", "gr"]
+
+# Faixa de salários mensais plausíveis (fora dela o valor é tratado como erro de digitação,
+# em geral salário anual ou em centavos digitado como mensal)
+SALARIO_MINIMO_VALIDO = 300
+SALARIO_MAXIMO_VALIDO = 100_000
+
+# Outliers: cercas de IQR sobre o log do salário, por (cargo, região)
+GRUPO_OUTLIER = ["cargo", "regiao"]
+GRUPO_OUTLIER_RESERVA = ["setor", "regiao"]  # usado quando o grupo principal tem poucas vagas
+MINIMO_VAGAS_GRUPO = 4
+FATOR_IQR = 3.0
+IQR_MINIMO = 0.25  # evita marcar tudo como outlier em grupos com salários quase iguais
+
+# Vagas repetidas (o mesmo anúncio coletado várias vezes) contam uma vez só no cálculo das cercas
+CHAVE_VAGA_DISTINTA = ["cargo", "regiao", "empresa", "salario"]
+
+# Motivos de rejeição registrados em cada linha (vazio = salário aceito)
+MOTIVOS_REJEICAO = ["ausente", "invalido", "fora_da_faixa", "outlier"]
+
+# Motivos que colocam a vaga em quarentena (havia um salário, mas ele foi descartado)
+MOTIVOS_QUARENTENA = ["invalido", "fora_da_faixa", "outlier"]
+
+
+# Função para marcar como nulos os textos que significam "sem valor"
+def limpar_ausentes(serie):
+    texto = serie.astype("string").str.strip()
+    return texto.mask(texto.str.lower().isin(MARCADORES_AUSENTES))
+
+
+# Função para converter salários escritos como texto ("R$ 9.000,00", "9000", "Não informado")
+def converter_salario(serie):
+    texto = limpar_ausentes(serie).str.replace(r"[R$\s]", "", regex=True)
+    # Formato brasileiro: ponto como milhar e vírgula como decimal
+    com_virgula = texto.str.contains(",", regex=False, na=False)
+    texto = texto.mask(com_virgula, texto.str.replace(".", "", regex=False).str.replace(",", ".", regex=False))
+    so_milhar = texto.str.fullmatch(r"\d{1,3}(\.\d{3})+", na=False)
+    texto = texto.mask(so_milhar, texto.str.replace(".", "", regex=False))
+    return pd.to_numeric(texto, errors="coerce").astype(float), texto.notna()
+
+
+# Função para aplicar o esquema: cria colunas ausentes e converte cada uma para o seu tipo
+def aplicar_esquema(df):
+    df = df.copy()
+    for coluna in ESQUEMA:
+        if coluna not in df.columns:
+            df[coluna] = np.nan
+
+    for coluna, tipo in ESQUEMA.items():
+        if tipo == "texto":
+            df[coluna] = limpar_ausentes(df[coluna]).astype(object).where(lambda s: s.notna(), np.nan)
+        elif tipo == "inteiro":
+            df[coluna] = pd.to_numeric(df[coluna], errors="coerce").astype("Int64")
+        elif tipo == "data":
+            df[coluna] = pd.to_datetime(df[coluna], errors="coerce")
+
+    # Porte da empresa em minúsculas; valores fora da lista viram nulos
+    empresa = df["empresa"].str.lower()
+    df["empresa"] = empresa.where(empresa.isin(PORTES_EMPRESA), np.nan)
+    return df
+
+
+# Função para calcular, em uma passada agrupada, as cercas de IQR do log do salário
+def cercas_iqr(dados, grupo):
+    agrupado = dados.groupby(grupo, observed=True, dropna=False)["log_salario"]
+    cercas = agrupado.quantile([0.25, 0.75]).unstack()
+    cercas.columns = ["q1", "q3"]
+    cercas["n"] = agrupado.count()
+    iqr = np.maximum(cercas["q3"] - cercas["q1"], IQR_MINIMO)
+    cercas["inferior"] = cercas["q1"] - FATOR_IQR * iqr
+    cercas["superior"] = cercas["q3"] + FATOR_IQR * iqr
+    return cercas[["n", "inferior", "superior"]]
+
+
+# Função para marcar os salários atípicos dentro de cada (cargo, região). As cercas são
+# calculadas sobre as vagas distintas e aplicadas a todas as linhas.
+def marcar_outliers(df):
+    validos = df["salario"].notna()
+    dados = df.loc[validos, list(dict.fromkeys(GRUPO_OUTLIER + GRUPO_OUTLIER_RESERVA))]
+    dados = dados.assign(log_salario=np.log(df.loc[validos, "salario"]))
+    distintas = df.loc[validos, list(dict.fromkeys(CHAVE_VAGA_DISTINTA + GRUPO_OUTLIER + GRUPO_OUTLIER_RESERVA))]
+    distintas = distintas.drop_duplicates(subset=CHAVE_VAGA_DISTINTA)
+    distintas = distintas.assign(log_salario=np.log(distintas["salario"]))
+
+    principal = dados.join(cercas_iqr(distintas, GRUPO_OUTLIER), on=GRUPO_OUTLIER)
+    reserva = dados.join(cercas_iqr(distintas, GRUPO_OUTLIER_RESERVA), on=GRUPO_OUTLIER_RESERVA)
+    usar_principal = principal["n"] >= MINIMO_VAGAS_GRUPO
+    inferior = np.where(usar_principal, principal["inferior"], reserva["inferior"])
+    superior = np.where(usar_principal, principal["superior"], reserva["superior"])
+
+    outlier = pd.Series(False, index=df.index)
+    outlier[validos] = (dados["log_salario"] < inferior) | (dados["log_salario"] > superior)
+    return outlier
+
+
+# Função de validação executada na ingestão: aplica o esquema, converte salários e coloca em
+# quarentena (salario = NaN, valor original guardado) os inválidos e os outliers
+def validar_dados(df):
+    df = aplicar_esquema(df)
+
+    salario_original = df["salario"]
+    salario, informado = converter_salario(salario_original)
+    motivo = pd.Series(np.nan, index=df.index, dtype=object)
+    motivo[~informado] = "ausente"
+    motivo[informado & salario.isna()] = "invalido"
+    fora_da_faixa = salario.notna() & ~salario.between(SALARIO_MINIMO_VALIDO, SALARIO_MAXIMO_VALIDO)
+    motivo[fora_da_faixa] = "fora_da_faixa"
+    df["salario"] = salario.mask(fora_da_faixa)
+
+    outlier = marcar_outliers(df)
+    motivo[outlier] = "outlier"
+    df["salario"] = df["salario"].mask(outlier)
+
+    df["salario_original"] = salario_original.astype("string")
+    df["motivo_rejeicao"] = pd.Categorical(motivo, categories=MOTIVOS_REJEICAO)
+    return df
+
+
+# Função para resumir a validação: quantidade de salários descartados por motivo
+# (vagas sem salário informado não entram aqui; ver vagas_sem_salario)
+def resumo_validacao(df):
+    contagem = df["motivo_rejeicao"].value_counts().reindex(MOTIVOS_QUARENTENA, fill_value=0)
+    return pd.DataFrame({"Motivo": contagem.index, "Linhas": contagem.to_numpy()})
+
+
+# Função para contar as vagas que vieram sem salário informado
+def vagas_sem_salario(df):
+    return int((df["motivo_rejeicao"] == "ausente").sum())
+
+
+# Função para listar as vagas em quarentena (salário rejeitado por ser inválido ou atípico)
+def quarentena(df):
+    rejeitados = df["motivo_rejeicao"].isin(MOTIVOS_QUARENTENA)
+    return df.loc[rejeitados, ["id", "cargo", "setor", "regiao", "empresa", "salario_original", "motivo_rejeicao"]]